@@ -255,16 +255,18 @@ class DatabaseManager:
                 - source_type: str
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT id, timestamp, text, language, duration, model_used, source_type
-                FROM transcriptions
-                ORDER BY timestamp DESC, id DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset))
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    SELECT id, timestamp, text, language, duration, model_used, source_type
+                    FROM transcriptions
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT ? OFFSET ?
+                """, (limit, offset))
+                rows = cursor.fetchall()
 
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 results.append({
                     'id': row['id'],
                     'timestamp': self._format_timestamp(row['timestamp']),
@@ -290,9 +292,10 @@ class DatabaseManager:
             Total number of transcriptions
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM transcriptions")
-            row = cursor.fetchone()
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("SELECT COUNT(*) as count FROM transcriptions")
+                row = cursor.fetchone()
             count = row['count'] if row else 0
             logger.debug(f"Total transcriptions: {count}")
             return count
@@ -314,19 +317,20 @@ class DatabaseManager:
             return []
 
         try:
-            cursor = self.conn.cursor()
-
             # Case-insensitive search using LIKE
             search_pattern = f"%{query.strip()}%"
-            cursor.execute("""
-                SELECT id, timestamp, text, language, duration, model_used
-                FROM transcriptions
-                WHERE text LIKE ?
-                ORDER BY timestamp DESC, id DESC
-            """, (search_pattern,))
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    SELECT id, timestamp, text, language, duration, model_used
+                    FROM transcriptions
+                    WHERE text LIKE ?
+                    ORDER BY timestamp DESC, id DESC
+                """, (search_pattern,))
+                rows = cursor.fetchall()
 
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 results.append({
                     'id': row['id'],
                     'timestamp': self._format_timestamp(row['timestamp']),
@@ -358,15 +362,17 @@ class DatabaseManager:
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT timestamp, text
-                FROM transcriptions
-                ORDER BY timestamp ASC
-            """)
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    SELECT timestamp, text
+                    FROM transcriptions
+                    ORDER BY timestamp ASC
+                """)
+                rows = cursor.fetchall()
 
             with open(filepath, 'w', encoding='utf-8') as f:
-                for row in cursor.fetchall():
+                for row in rows:
                     # Parse and format timestamp
                     dt = datetime.fromisoformat(row['timestamp'])
                     timestamp_str = dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -401,15 +407,17 @@ class DatabaseManager:
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT id, timestamp, text, language, duration, model_used, audio_path
-                FROM transcriptions
-                ORDER BY timestamp ASC
-            """)
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    SELECT id, timestamp, text, language, duration, model_used, audio_path
+                    FROM transcriptions
+                    ORDER BY timestamp ASC
+                """)
+                rows = cursor.fetchall()
 
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 results.append({
                     'id': row['id'],
                     'timestamp': row['timestamp'],
@@ -443,14 +451,15 @@ class DatabaseManager:
             raise ValueError("Days must be non-negative")
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM transcriptions
-                WHERE timestamp < datetime('now', ?)
-            """, (f'-{days} days',))
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    DELETE FROM transcriptions
+                    WHERE timestamp < datetime('now', ?)
+                """, (f'-{days} days',))
 
-            self.conn.commit()
-            deleted_count = cursor.rowcount
+                self.conn.commit()
+                deleted_count = cursor.rowcount
 
             logger.info(f"Cleaned up {deleted_count} transcriptions older than {days} days")
             return deleted_count
@@ -467,11 +476,12 @@ class DatabaseManager:
             Number of rows deleted
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM transcriptions")
-            
-            self.conn.commit()
-            deleted_count = cursor.rowcount
+            with self._db_lock:
+                cursor = self.conn.cursor()
+                cursor.execute("DELETE FROM transcriptions")
+
+                self.conn.commit()
+                deleted_count = cursor.rowcount
             
             logger.info(f"Cleared all history: {deleted_count} transcriptions deleted")
             return deleted_count
@@ -494,31 +504,33 @@ class DatabaseManager:
             }
         """
         try:
-            cursor = self.conn.cursor()
+            with self._db_lock:
+                cursor = self.conn.cursor()
 
-            # Get total count
-            cursor.execute("SELECT COUNT(*) as count FROM transcriptions")
-            total_count = cursor.fetchone()['count']
+                # Get total count
+                cursor.execute("SELECT COUNT(*) as count FROM transcriptions")
+                total_count = cursor.fetchone()['count']
 
-            # Get total duration
-            cursor.execute("SELECT SUM(duration) as total FROM transcriptions")
-            total_duration = cursor.fetchone()['total'] or 0.0
+                # Get total duration
+                cursor.execute("SELECT SUM(duration) as total FROM transcriptions")
+                total_duration = cursor.fetchone()['total'] or 0.0
 
-            # Get language distribution
-            cursor.execute("""
-                SELECT language, COUNT(*) as count
-                FROM transcriptions
-                WHERE language IS NOT NULL
-                GROUP BY language
-            """)
-            languages = {row['language']: row['count'] for row in cursor.fetchall()}
+                # Get language distribution
+                cursor.execute("""
+                    SELECT language, COUNT(*) as count
+                    FROM transcriptions
+                    WHERE language IS NOT NULL
+                    GROUP BY language
+                """)
+                languages = {row['language']: row['count'] for row in cursor.fetchall()}
+
+                # Get date range
+                cursor.execute("""
+                    SELECT MIN(timestamp) as oldest, MAX(timestamp) as newest
+                    FROM transcriptions
+                """)
+                row = cursor.fetchone()
 
-            # Get date range
-            cursor.execute("""
-                SELECT MIN(timestamp) as oldest, MAX(timestamp) as newest
-                FROM transcriptions
-            """)
-            row = cursor.fetchone()
             oldest_date = row['oldest'] or ''
             newest_date = row['newest'] or ''
 
@@ -685,8 +697,8 @@ class DatabaseManager:
         """
         try:
             query = "SELECT * FROM transcription_jobs WHERE id = ?"
-            cursor = self.conn.execute(query, (job_id,))
-            row = cursor.fetchone()
+            with self._db_lock:
+                row = self.conn.execute(query, (job_id,)).fetchone()
 
             if not row:
                 return None
@@ -720,8 +732,8 @@ class DatabaseManager:
                 ORDER BY priority ASC, created_at ASC
             """
 
-            cursor = self.conn.execute(query)
-            rows = cursor.fetchall()
+            with self._db_lock:
+                rows = self.conn.execute(query).fetchall()
 
             jobs = []
             for row in rows:
@@ -767,8 +779,9 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, ?)
             """
 
-            cursor = self.conn.execute(query, (job_id, chunk_index, text, start_time, end_time))
-            self.conn.commit()
+            with self._db_lock:
+                cursor = self.conn.execute(query, (job_id, chunk_index, text, start_time, end_time))
+                self.conn.commit()
 
             logger.debug(f"Added chunk {chunk_index} for job {job_id}")
             return cursor.lastrowid
@@ -795,8 +808,8 @@ class DatabaseManager:
                 ORDER BY chunk_index ASC
             """
 
-            cursor = self.conn.execute(query, (job_id,))
-            rows = cursor.fetchall()
+            with self._db_lock:
+                rows = self.conn.execute(query, (job_id,)).fetchall()
 
             chunks = [dict(row) for row in rows]
             logger.debug(f"Retrieved {len(chunks)} chunks for job {job_id}")
@@ -814,13 +827,14 @@ class DatabaseManager:
             job_id: Job ID to delete
         """
         try:
-            # Delete chunks first (foreign key constraint)
-            self.conn.execute("DELETE FROM transcription_chunks WHERE job_id = ?", (job_id,))
+            with self._db_lock:
+                # Delete chunks first (foreign key constraint)
+                self.conn.execute("DELETE FROM transcription_chunks WHERE job_id = ?", (job_id,))
 
-            # Delete job
-            self.conn.execute("DELETE FROM transcription_jobs WHERE id = ?", (job_id,))
+                # Delete job
+                self.conn.execute("DELETE FROM transcription_jobs WHERE id = ?", (job_id,))
 
-            self.conn.commit()
+                self.conn.commit()
             logger.info(f"Deleted job {job_id} and its chunks")
 
         except sqlite3.Error as e:
@@ -841,33 +855,35 @@ class DatabaseManager:
             cutoff_date = datetime.now() - timedelta(days=days)
             cutoff_str = cutoff_date.strftime('%Y-%m-%d %H:%M:%S')
 
-            # Get job IDs to delete
-            cursor = self.conn.execute("""
-                SELECT id FROM transcription_jobs
-                WHERE status IN (3, 4, 5)
-                AND completed_at < ?
-            """, (cutoff_str,))
-
-            job_ids = [row[0] for row in cursor.fetchall()]
-
-            if not job_ids:
-                logger.info("No old jobs to clean up")
-                return 0
+            with self._db_lock:
+                # Get job IDs to delete
+                cursor = self.conn.execute("""
+                    SELECT id FROM transcription_jobs
+                    WHERE status IN (3, 4, 5)
+                    AND completed_at < ?
+                """, (cutoff_str,))
+
+                job_ids = [row[0] for row in cursor.fetchall()]
+
+                if not job_ids:
+                    logger.info("No old jobs to clean up")
+                    return 0
+
+                # Delete chunks for these jobs
+                placeholders = ','.join('?' * len(job_ids))
+                self.conn.execute(
+                    f"DELETE FROM transcription_chunks WHERE job_id IN ({placeholders})",
+                    job_ids
+                )
 
-            # Delete chunks for these jobs
-            placeholders = ','.join('?' * len(job_ids))
-            self.conn.execute(
-                f"DELETE FROM transcription_chunks WHERE job_id IN ({placeholders})",
-                job_ids
-            )
+                # Delete jobs
+                self.conn.execute(
+                    f"DELETE FROM transcription_jobs WHERE id IN ({placeholders})",
+                    job_ids
+                )
 
-            # Delete jobs
-            self.conn.execute(
-                f"DELETE FROM transcription_jobs WHERE id IN ({placeholders})",
-                job_ids
-            )
+                self.conn.commit()
 
-            self.conn.commit()
             logger.info(f"Cleaned up {len(job_ids)} old jobs")
             return len(job_ids)
 
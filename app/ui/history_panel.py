@@ -11,9 +11,11 @@ Displays transcription history with:
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
     QFrame, QMessageBox, QFileDialog, QApplication, QScrollArea,
-    QGridLayout, QSizePolicy
+    QSizePolicy
+)
+from PySide6.QtCore import (
+    Signal, Qt, QSize, QTimer, QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Signal, Qt, QSize, QEvent, QTimer
 from PySide6.QtGui import QFont
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +24,37 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class _HistoryFetchSignals(QObject):
+    """Signals used to hand history fetch results back to the UI thread"""
+
+    # generation, offset, transcriptions, total_count
+    fetched = Signal(int, int, list, int)
+    # generation, error message
+    failed = Signal(int, str)
+
+
+class _HistoryFetchTask(QRunnable):
+    """Fetches one page of history from the database on the thread pool"""
+
+    def __init__(self, fetch_rows, signals, generation, offset, limit, source_filter):
+        super().__init__()
+        self._fetch_rows = fetch_rows
+        self._signals = signals
+        self._generation = generation
+        self._offset = offset
+        self._limit = limit
+        self._source_filter = source_filter
+
+    def run(self):
+        try:
+            transcriptions, total_count = self._fetch_rows(
+                self._offset, self._limit, self._source_filter
+            )
+            self._signals.fetched.emit(self._generation, self._offset, transcriptions, total_count)
+        except Exception as e:
+            self._signals.failed.emit(self._generation, str(e))
+
+
 class HistoryPanel(QWidget):
     """
     Displays transcription history with search and export.
@@ -46,6 +79,7 @@ class HistoryPanel(QWidget):
         self.current_offset = 0  # Pagination offset
         self.page_size = 50  # Items per page
         self.has_more_items = True  # Whether there are more items to load
+        self.total_count = 0  # Rows in the database at the last fetch
 
         # Debounce timer to prevent rapid reloads
         self.reload_timer = QTimer()
@@ -53,10 +87,15 @@ class HistoryPanel(QWidget):
         self.reload_timer.setInterval(300)  # 300ms debounce
         self.reload_timer.timeout.connect(self._perform_reload)
 
-        self._setup_ui()
+        # Database fetches run on the global thread pool; results are
+        # delivered back to the UI thread through queued signals
+        self._fetch_generation = 0
+        self._fetch_in_flight = False
+        self._fetch_signals = _HistoryFetchSignals(self)
+        self._fetch_signals.fetched.connect(self._populate, Qt.ConnectionType.QueuedConnection)
+        self._fetch_signals.failed.connect(self._on_fetch_failed, Qt.ConnectionType.QueuedConnection)
 
-        # Install event filter for resize handling
-        self.installEventFilter(self)
+        self._setup_ui()
 
         logger.info("HistoryPanel initialized")
 
@@ -196,14 +235,16 @@ class HistoryPanel(QWidget):
             }
         """)
         
-        self.grid_container = QWidget()
-        self.grid_container.setStyleSheet("background-color: transparent;")
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(12)
-        self.grid_layout.setContentsMargins(0, 0, 16, 0) # Right padding for scrollbar
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        # Single column of cards: new items are inserted in place and
+        # filtered items are hidden, so the list never needs a full relayout
+        self.cards_container = QWidget()
+        self.cards_container.setStyleSheet("background-color: transparent;")
+        self.cards_layout = QVBoxLayout(self.cards_container)
+        self.cards_layout.setSpacing(12)
+        self.cards_layout.setContentsMargins(0, 0, 16, 0) # Right padding for scrollbar
+        self.cards_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
-        self.scroll_area.setWidget(self.grid_container)
+        self.scroll_area.setWidget(self.cards_container)
         layout.addWidget(self.scroll_area, 1)
 
         # Footer buttons
@@ -337,78 +378,123 @@ class HistoryPanel(QWidget):
     def _perform_reload(self):
         """
         Actually reload history after debounce period.
-        Loads items based on current pagination state.
+        Fetches items for the current pagination state on the thread pool;
+        the UI is updated in _populate once the rows arrive.
         """
         if not self._pending_reload:
             return
 
         self._pending_reload = False
 
-        try:
-            # Fetch transcriptions from database with pagination
-            transcriptions = self.db.get_recent_transcriptions(
-                limit=self.page_size,
-                offset=self.current_offset
-            )
+        # Newer requests supersede any fetch still in flight
+        self._fetch_generation += 1
+        self._fetch_in_flight = True
+        QThreadPool.globalInstance().start(_HistoryFetchTask(
+            self._fetch_rows,
+            self._fetch_signals,
+            self._fetch_generation,
+            self.current_offset,
+            self.page_size,
+            self.current_filter
+        ))
+
+    def _fetch_rows(self, offset: int, limit: int, source_filter=None) -> tuple:
+        """
+        Fetch a page of transcriptions from the database.
 
-            # Check if there are more items
-            total_count = self.db.get_transcription_count()
-            self.has_more_items = (self.current_offset + self.page_size) < total_count
-
-            # Apply source type filter if set
-            if self.current_filter:
-                transcriptions = [
-                    t for t in transcriptions
-                    if t.get('source_type') == self.current_filter
-                ]
-
-            # If this is the first page (offset=0), replace all content
-            if self.current_offset == 0:
-                # Check if content actually changed (avoid unnecessary UI updates)
-                if not self._has_content_changed(transcriptions):
-                    logger.debug("History content unchanged, skipping UI update")
-                    # Still update Load More button visibility
-                    self.load_more_btn.setVisible(self.has_more_items)
-                    return
-
-                # Clear existing
-                self._clear_grid()
-
-                # Store data
-                self.current_transcriptions = transcriptions
-
-                # Reset widgets list
-                self.history_widgets = []
-            else:
-                # Append mode: add to existing transcriptions
-                self.current_transcriptions.extend(transcriptions)
-
-            # Create widgets for new transcriptions
-            for trans in transcriptions:
-                widget = self._create_history_item_widget(trans)
-                widget.show()  # Ensure widget is visible for layout
-                self.history_widgets.append(widget)
-
-            # Layout
-            self._update_grid_layout()
-
-            # Update Load More button visibility
-            self.load_more_btn.setVisible(self.has_more_items)
-            if self.has_more_items:
-                remaining = total_count - (self.current_offset + len(transcriptions))
-                self.load_more_btn.setText(f"Load More... ({remaining} remaining)")
-            else:
-                self.load_more_btn.setText("Load More...")
-
-            logger.info(f"Loaded {len(transcriptions)} transcriptions (total: {len(self.current_transcriptions)})")
+        Runs on a worker thread, so it must not touch any widgets.
 
-        except Exception as e:
-            logger.error(f"Failed to load history: {e}")
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to load history:\n{str(e)}"
-            )
+        Args:
+            offset: Pagination offset
+            limit: Page size
+            source_filter: Optional source_type to keep ('microphone', 'file')
+
+        Returns:
+            (transcriptions, total_count) tuple
+        """
+        # Fetch transcriptions from database with pagination
+        transcriptions = self.db.get_recent_transcriptions(limit=limit, offset=offset)
+        total_count = self.db.get_transcription_count()
+
+        # Apply source type filter if set
+        if source_filter:
+            transcriptions = [
+                t for t in transcriptions
+                if t.get('source_type') == source_filter
+            ]
+
+        return transcriptions, total_count
+
+    def _populate(self, generation: int, offset: int, transcriptions: list, total_count: int):
+        """
+        Update the history list with fetched rows (UI thread).
+
+        Args:
+            generation: Fetch generation the rows belong to
+            offset: Pagination offset the rows were fetched for
+            transcriptions: Fetched transcription dicts
+            total_count: Total number of transcriptions in the database
+        """
+        if generation != self._fetch_generation:
+            return  # Superseded by a newer request
+        self._fetch_in_flight = False
+
+        # Check if there are more items
+        self.total_count = total_count
+        self.has_more_items = (offset + self.page_size) < total_count
+
+        # If this is the first page (offset=0), replace all content
+        if offset == 0:
+            # Check if content actually changed (avoid unnecessary UI updates)
+            if not self._has_content_changed(transcriptions):
+                logger.debug("History content unchanged, skipping UI update")
+                # Still update the Load More button
+                self._update_load_more_button()
+                return
+
+            # Clear existing
+            self._clear_cards()
+
+            # Store data
+            self.current_transcriptions = transcriptions
+
+            # Reset widgets list
+            self.history_widgets = []
+        else:
+            # Append mode: add to existing transcriptions
+            self.current_transcriptions.extend(transcriptions)
+
+        # Create widgets for new transcriptions
+        for trans in transcriptions:
+            widget = self._create_history_item_widget(trans)
+            self.cards_layout.addWidget(widget)
+            self.history_widgets.append(widget)
+
+        self._update_load_more_button()
+
+        logger.info(f"Loaded {len(transcriptions)} transcriptions (total: {len(self.current_transcriptions)})")
+
+    def _update_load_more_button(self):
+        """Show the Load More button with the number of rows not fetched yet"""
+        self.load_more_btn.setVisible(self.has_more_items)
+        if self.has_more_items:
+            remaining = self.total_count - (self.current_offset + self.page_size)
+            self.load_more_btn.setText(f"Load More... ({remaining} remaining)")
+        else:
+            self.load_more_btn.setText("Load More...")
+
+    def _on_fetch_failed(self, generation: int, error: str):
+        """Report a failed history fetch (UI thread)"""
+        if generation != self._fetch_generation:
+            return
+        self._fetch_in_flight = False
+
+        logger.error(f"Failed to load history: {error}")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to load history:\n{error}"
+        )
 
     def _load_more(self):
         """Load next page of transcriptions"""
@@ -425,8 +511,8 @@ class HistoryPanel(QWidget):
         """
         if not query or not query.strip():
             # Show all items
-            for i in range(self.history_list.count()):
-                self.history_list.item(i).setHidden(False)
+            for widget in self.history_widgets:
+                widget.show()
             return
 
         try:
@@ -434,17 +520,9 @@ class HistoryPanel(QWidget):
             results = self.db.search_transcriptions(query)
             result_ids = {r['id'] for r in results}
 
-            # Filter widgets
-            visible_widgets = []
+            # Filter widgets (hidden cards take no space in the layout)
             for widget in self.history_widgets:
-                if widget.transcription_id in result_ids:
-                    widget.show()
-                    visible_widgets.append(widget)
-                else:
-                    widget.hide()
-            
-            # Re-layout only visible widgets
-            self._reflow_grid(visible_widgets)
+                widget.setVisible(widget.transcription_id in result_ids)
 
             logger.debug(f"Search '{query}' found {len(results)} results")
 
@@ -457,62 +535,45 @@ class HistoryPanel(QWidget):
         """
         # Create widget
         widget = self._create_history_item_widget(transcription)
-        widget.show() # Ensure widget is visible
-        
-        # Insert at beginning
+
+        # Insert at beginning; only the new card is laid out
+        self.cards_layout.insertWidget(0, widget)
         self.history_widgets.insert(0, widget)
         self.current_transcriptions.insert(0, transcription)
-        
-        # Update layout
-        self._update_grid_layout()
-        
-    def _clear_grid(self):
-        """Remove all items from grid"""
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.history_widgets = []
 
-    def eventFilter(self, obj, event):
-        """Handle resize events to reflow grid"""
-        if obj == self and event.type() == QEvent.Type.Resize:
-            self._update_grid_layout()
-        return super().eventFilter(obj, event)
+    def append_transcription(self, transcription: dict):
+        """
+        Show a newly added transcription without rebuilding the whole list.
 
-    def _update_grid_layout(self):
-        """Reflow all widgets"""
-        self._reflow_grid(self.history_widgets)
+        Falls back to a (debounced) full reload when the row cannot simply
+        be prepended, e.g. while a search is active or a reload is pending.
 
-    def _reflow_grid(self, widgets_to_layout):
-        """
-        Place widgets in grid based on width.
-        2 columns if width < 800, 3 columns otherwise.
-        """
-        # Clear layout (but don't delete widgets!)
-        while self.grid_layout.count():
-            self.grid_layout.takeAt(0)
-            
-    def _reflow_grid(self, widgets_to_layout):
-        """
-        Place widgets in grid.
-        Fixed layout: 2 columns.
+        Args:
+            transcription: Dict with transcription data
         """
-        # Clear layout (but don't delete widgets!)
-        while self.grid_layout.count():
-            self.grid_layout.takeAt(0)
-            
-        cols = 1
-        
-        for i, widget in enumerate(widgets_to_layout):
-            if not widget.isHidden():
-                row = i // cols
-                col = i % cols
-                self.grid_layout.addWidget(widget, row, col)
-
-        # Set column stretch to equal to prevent weird resizing
-        for c in range(cols):
-            self.grid_layout.setColumnStretch(c, 1)
+        if self._pending_reload or self._fetch_in_flight or self.search_input.text().strip():
+            self.load_history()
+            return
+
+        # The new row is now first in the database, shifting every loaded page
+        # down by one; keep the next Load More from fetching a row already shown
+        self.current_offset += 1
+        self.total_count += 1
+        self._update_load_more_button()
+
+        # Hidden by the active source filter
+        if self.current_filter and transcription.get('source_type') != self.current_filter:
+            return
+
+        self.add_transcription_item(transcription)
+
+    def _clear_cards(self):
+        """Remove all cards from the list"""
+        while self.cards_layout.count():
+            item = self.cards_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self.history_widgets = []
 
     def _create_history_item_widget(self, transcription: dict) -> QWidget:
         """
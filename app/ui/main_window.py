@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QStackedWidget,
     QListWidget, QListWidgetItem, QLabel, QStatusBar, QPushButton
 )
-from PySide6.QtCore import Signal, Qt, QSize
+from PySide6.QtCore import Signal, Qt, QSize, QTimer
 from PySide6.QtGui import QIcon, QFont
 import logging
 
@@ -24,6 +24,43 @@ from app.core.state_machine import ApplicationState
 
 logger = logging.getLogger(__name__)
 
+# Status bar text colors, keyed by status message
+_STATUS_COLORS = {
+    "Ready": "#00ff00",
+    "Recording": "#ff9900",
+    "Processing": "#ffff00",
+    "Error": "#ff0000"
+}
+
+# Precomputed status label stylesheets, so updates never format QSS
+_STATUS_STYLE = {
+    message: f"color: {color}; font-weight: bold;"
+    for message, color in _STATUS_COLORS.items()
+}
+_DEFAULT_STATUS_STYLE = "color: #cccccc; font-weight: bold;"
+
+_MB_TO_GB = 1.0 / 1024.0
+
+# Sidebar row -> stack index
+# Rows: 0=History, 1=File Transcribe, 2=Batch Files, 3=Settings, 4=About
+# Non-selectable rows (e.g. spacers) map to -1
+_ROW_TO_STACK = (0, 1, 2, 3, 4)
+
+# Qt enum values resolved once at import instead of per window construction
+# (maximize button disabled, close and minimize kept)
+_WIN_FLAGS = (
+    Qt.WindowType.Window |
+    Qt.WindowType.CustomizeWindowHint |
+    Qt.WindowType.WindowTitleHint |
+    Qt.WindowType.WindowSystemMenuHint |
+    Qt.WindowType.WindowMinimizeButtonHint |
+    Qt.WindowType.WindowCloseButtonHint
+)
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_QUEUED = Qt.ConnectionType.QueuedConnection
+
+# Shared size hint for sidebar items
+_SIDEBAR_SIZE = QSize(140, 45)
 
 class MainWindow(QMainWindow):
     """
@@ -55,32 +92,43 @@ class MainWindow(QMainWindow):
         # Store panels
         self.history_panel = None
         self.file_transcribe_panel = None
+        self.batch_transcribe_panel = None
         self.settings_panel = None
         self.about_panel = None
 
         # Status bar labels
         self.status_label = None
-        self.model_label = None
-        self.vram_label = None
+        self.stats_label = None
         self.ptt_button = None
 
-        self.setWindowTitle("Whisper-Free")
+        # Model/VRAM values shown in stats_label
+        self._model_name = self.config.get('whisper.model', 'small')
+        self._vram_text = "N/A"
+
+        # Pending status bar values, flushed together by _status_timer
+        self._pending_status = None
+        self._pending_vram = None
+        self._last_status_style = None
+        self._last_status_text = None
+        self._last_vram_text = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(100)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+
         self.setWindowTitle("Whisper-Free")
         self.setFixedSize(800, 600)
         
         # Disable maximize button, keep close and minimize
-        self.setWindowFlags(
-            Qt.WindowType.Window |
-            Qt.WindowType.CustomizeWindowHint |
-            Qt.WindowType.WindowTitleHint |
-            Qt.WindowType.WindowSystemMenuHint |
-            Qt.WindowType.WindowMinimizeButtonHint |
-            Qt.WindowType.WindowCloseButtonHint
-        )
+        self.setWindowFlags(_WIN_FLAGS)
 
+        # Defer repaints until construction is done so that populating the
+        # sidebar and stack does not queue intermediate update passes
+        self.setUpdatesEnabled(False)
         self._setup_ui()
         self._apply_theme()
         self._load_history()
+        self.setUpdatesEnabled(True)
 
         logger.info("MainWindow initialized")
 
@@ -108,127 +156,116 @@ class MainWindow(QMainWindow):
         self.sidebar.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         # Add sidebar items
-        items = ["History", "Settings", "About"]
-        for item_text in items:
-            item = QListWidgetItem(item_text)
-            item.setSizeHint(QSize(140, 45))
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.sidebar.addItem(item)
-
-        # Connect sidebar selection
-        self.sidebar.currentRowChanged.connect(self._on_sidebar_changed)
-        
-        # Add spacing for About button (a bit of a hack with QListWidget)
-        # We'll just rely on the order for now, or we could add a spacer item
-        # but custom widgets in QListWidget are tricky without full delegates.
-        # User requested "About... into middle also as well".
-        # Let's try to set a custom size for the item before About?
-        # Or just leave it as is but cleaner. The request "About... into middle"
-        # is vague. Let's assume they want it separated. 
-        # I'll add a dummy spacer item.
-        
-        spacer_item = QListWidgetItem("")
-        spacer_item.setFlags(Qt.ItemFlag.NoItemFlags) # Non-selectable
-        spacer_item.setSizeHint(QSize(140, 20)) # Spacer height
-        self.sidebar.insertItem(2, spacer_item) # Insert before About (index 2 was About)
-        
-        # Re-add About (it will be index 3 now)
-        # Actually, "About" was added in the loop. 
-        # The loop added History(0), Settings(1), About(2).
-        # We need to take item 2 and move it to 3 after spacer.
-        # Or easier: Clear and re-add manually.
-        
-        self.sidebar.clear()
-
-        # Top items
-        for text in ["History", "File Transcribe", "Batch Files", "Settings"]:
-            item = QListWidgetItem(text)
-            item.setSizeHint(QSize(140, 45))
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.sidebar.addItem(item)
-        # About item
-        about_item = QListWidgetItem("About")
-        about_item.setSizeHint(QSize(140, 45))
-        about_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.sidebar.addItem(about_item)
+        for text in ["History", "File Transcribe", "Batch Files", "Settings", "About"]:
+            self.sidebar.addItem(self._make_sidebar_item(text))
 
         # Stacked widget for panels
         self.stack = QStackedWidget()
 
         # Create panels
+        # History and Settings are built eagerly: history is loaded at
+        # startup and the application connects to Settings signals right away
         self.history_panel = HistoryPanel(self.db)
-
-        # File transcribe panel (only if whisper_engine and queue_manager are available)
-        if self.whisper_engine and self.queue_manager:
-            self.file_transcribe_panel = FileTranscribePanel(
-                self.config,
-                self.whisper_engine,
-                self.db,
-                self.queue_manager
-            )
-        else:
-            # Create placeholder if engine not available
-            self.file_transcribe_panel = self._create_placeholder_panel(
-                "File Transcribe",
-                "File transcription requires WhisperEngine.\nPlease restart the application."
-            )
-
-        # Batch transcribe panel (only if queue_manager is available)
-        if self.queue_manager:
-            self.batch_transcribe_panel = BatchTranscribePanel(
-                self.queue_manager,
-                self.config,
-                self.db
-            )
-        else:
-            # Create placeholder if queue manager not available
-            self.batch_transcribe_panel = self._create_placeholder_panel(
-                "Batch Files",
-                "Batch transcription requires TranscriptionQueueManager.\nPlease restart the application."
-            )
-
         self.settings_panel = SettingsPanel(self.config)
-        self.about_panel = self._create_about_panel()
-
-        # Add panels to stack (order matches sidebar)
-        self.stack.addWidget(self.history_panel)           # Index 0
-        self.stack.addWidget(self.file_transcribe_panel)   # Index 1
-        self.stack.addWidget(self.batch_transcribe_panel)  # Index 2
-        self.stack.addWidget(self.settings_panel)          # Index 3
-        self.stack.addWidget(self.about_panel)             # Index 4
 
-        # Connect settings panel signals
-        self.settings_panel.settings_saved.connect(self.settings_changed.emit)
+        # Remaining panels are only built the first time they are selected
+        # (stack index -> (attribute name, factory))
+        self._panel_factories = {
+            1: ('file_transcribe_panel', self._create_file_transcribe_panel),
+            2: ('batch_transcribe_panel', self._create_batch_transcribe_panel),
+            4: ('about_panel', self._create_about_panel),
+        }
 
-        # Connect file transcribe panel signals (if available)
-        if self.whisper_engine and hasattr(self.file_transcribe_panel, 'file_transcribed'):
-            self.file_transcribe_panel.file_transcribed.connect(self._on_file_transcribed)
+        # Add panels to stack (order matches sidebar); lazily-built panels
+        # get an empty stub until they are first selected
+        panels = [
+            self.history_panel,           # Index 0
+            self.file_transcribe_panel,   # Index 1
+            self.batch_transcribe_panel,  # Index 2
+            self.settings_panel,          # Index 3
+            self.about_panel,             # Index 4
+        ]
+        for panel in panels:
+            self.stack.addWidget(panel if panel is not None else QWidget())
+
+        # Connect settings panel signals; queued so the reload work runs
+        # after the Save click handler has returned
+        self.settings_panel.settings_saved.connect(
+            self.settings_changed.emit, _QUEUED
+        )
 
         # Add to main layout
         main_layout.addWidget(self.sidebar)
         main_layout.addWidget(self.stack, 1)  # Stretch factor 1
 
+        # Connect sidebar selection only once the sidebar and stack are fully
+        # populated, so building them does not fire spurious row changes
+        self.sidebar.currentRowChanged.connect(self._on_sidebar_changed)
+
         # Select History by default (Now safe to trigger signal)
         self.sidebar.setCurrentRow(0)
 
         # Status bar
         self._setup_status_bar()
 
+    @staticmethod
+    def _make_sidebar_item(text: str) -> QListWidgetItem:
+        """Create a centered sidebar navigation item"""
+        item = QListWidgetItem(text)
+        item.setSizeHint(_SIDEBAR_SIZE)
+        item.setTextAlignment(_ALIGN_CENTER)
+        return item
+
+    def _create_file_transcribe_panel(self) -> QWidget:
+        """Create the File Transcribe panel, or a placeholder if unavailable"""
+        # File transcribe panel (only if whisper_engine and queue_manager are available)
+        if not (self.whisper_engine and self.queue_manager):
+            return self._create_placeholder_panel(
+                "File Transcribe",
+                "File transcription requires WhisperEngine.\nPlease restart the application."
+            )
+
+        panel = FileTranscribePanel(
+            self.config,
+            self.whisper_engine,
+            self.db,
+            self.queue_manager
+        )
+        panel.file_transcribed.connect(
+            self._on_file_transcribed, _QUEUED
+        )
+        return panel
+
+    def _create_batch_transcribe_panel(self) -> QWidget:
+        """Create the Batch Files panel, or a placeholder if unavailable"""
+        # Batch transcribe panel (only if queue_manager is available)
+        if not self.queue_manager:
+            return self._create_placeholder_panel(
+                "Batch Files",
+                "Batch transcription requires TranscriptionQueueManager.\nPlease restart the application."
+            )
+
+        return BatchTranscribePanel(
+            self.queue_manager,
+            self.config,
+            self.db
+        )
+
     def _create_about_panel(self) -> QWidget:
         """Create the About panel with app information"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setAlignment(_ALIGN_CENTER)
 
         # App name
         title = QLabel("Whisper-Free")
-        title.setStyleSheet("font-size: 32px; font-weight: bold; color: #ffffff;")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setObjectName("aboutTitle")
+        title.setAlignment(_ALIGN_CENTER)
 
         # Version
         version = QLabel("Version 1.0.0")
-        version.setStyleSheet("font-size: 16px; color: #888888; margin-top: 8px;")
-        version.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        version.setObjectName("aboutVersion")
+        version.setAlignment(_ALIGN_CENTER)
 
         # Description
         description = QLabel(
@@ -237,14 +274,14 @@ class MainWindow(QMainWindow):
             "Press your hotkey to start recording,\n"
             "speak naturally, and get instant transcription."
         )
-        description.setStyleSheet("font-size: 14px; color: #cccccc; margin-top: 16px;")
-        description.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        description.setObjectName("aboutDescription")
+        description.setAlignment(_ALIGN_CENTER)
         description.setWordWrap(True)
 
         # License
         license_label = QLabel("MIT License")
-        license_label.setStyleSheet("font-size: 12px; color: #666666; margin-top: 24px;")
-        license_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        license_label.setObjectName("aboutLicense")
+        license_label.setAlignment(_ALIGN_CENTER)
 
         layout.addWidget(title)
         layout.addWidget(version)
@@ -258,15 +295,15 @@ class MainWindow(QMainWindow):
         """Create a placeholder panel with message"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setAlignment(_ALIGN_CENTER)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #ffffff;")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setObjectName("placeholderTitle")
+        title_label.setAlignment(_ALIGN_CENTER)
 
         message_label = QLabel(message)
-        message_label.setStyleSheet("font-size: 14px; color: #888888;")
-        message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        message_label.setObjectName("placeholderMessage")
+        message_label.setAlignment(_ALIGN_CENTER)
         message_label.setWordWrap(True)
 
         layout.addWidget(title_label)
@@ -309,16 +346,15 @@ class MainWindow(QMainWindow):
 
         # Status label
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #00ff00; font-weight: bold;")
-
-        # Model label
-        model_name = self.config.get('whisper.model', 'small')
-        self.model_label = QLabel(f"Model: {model_name}")
-        self.model_label.setStyleSheet("color: #cccccc; margin-left: 16px;")
+        self._last_status_text = "Ready"
+        self._last_status_style = _STATUS_STYLE["Ready"]
+        self.status_label.setStyleSheet(self._last_status_style)
 
-        # VRAM label
-        self.vram_label = QLabel("VRAM: N/A")
-        self.vram_label.setStyleSheet("color: #cccccc; margin-left: 16px;")
+        # Model and VRAM stats share a single label
+        self.stats_label = QLabel()
+        self.stats_label.setObjectName("statusStats")
+        self._last_vram_text = self._vram_text
+        self._refresh_stats_label()
 
         # Add to status bar
         # Use permanent widgets for Right-aligned system info to avoid overlap
@@ -328,17 +364,11 @@ class MainWindow(QMainWindow):
         
         status_bar.addWidget(self.ptt_button)
         status_bar.addWidget(self.status_label)
-        
-        # Create container for right side stats
-        stats_widget = QWidget()
-        stats_layout = QHBoxLayout(stats_widget)
-        stats_layout.setContentsMargins(0, 0, 0, 0)
-        stats_layout.setSpacing(16)
-        
-        stats_layout.addWidget(self.model_label)
-        stats_layout.addWidget(self.vram_label)
-        
-        status_bar.addPermanentWidget(stats_widget)
+        status_bar.addPermanentWidget(self.stats_label)
+
+    def _refresh_stats_label(self):
+        """Render model name and VRAM usage into the stats label"""
+        self.stats_label.setText(f"Model: {self._model_name}    VRAM: {self._vram_text}")
 
     def update_ptt_button(self, state: ApplicationState) -> None:
         """Update PTT button label and enabled state based on app state."""
@@ -363,15 +393,31 @@ class MainWindow(QMainWindow):
 
     def _on_sidebar_changed(self, row: int):
         """Handle sidebar selection change"""
-        # Map row index to stack index
-        # Rows: 0=History, 1=File Transcribe, 2=Settings, 3=About
-        # Stack indices match sidebar rows directly
-
-        if row >= 0 and row < self.stack.count():
-            self.stack.setCurrentIndex(row)
-            logger.debug(f"Sidebar changed to row {row}, stack index {self.stack.currentIndex()}")
+        index = _ROW_TO_STACK[row] if 0 <= row < len(_ROW_TO_STACK) else -1
+
+        if index >= 0:
+            self._materialize_panel(index)
+            self.stack.setCurrentIndex(index)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sidebar changed to row %d, stack index %d",
+                             row, self.stack.currentIndex())
         else:
-            logger.warning(f"Invalid sidebar row: {row}")
+            logger.warning("Invalid sidebar row: %d", row)
+
+    def _materialize_panel(self, index: int):
+        """Build a lazily-created panel and swap it in for its stack stub"""
+        entry = self._panel_factories.pop(index, None)
+        if entry is None:
+            return
+
+        attr_name, factory = entry
+        panel = factory()
+        setattr(self, attr_name, panel)
+
+        stub = self.stack.widget(index)
+        self.stack.removeWidget(stub)
+        stub.deleteLater()
+        self.stack.insertWidget(index, panel)
 
     def add_transcription(self, text: str, duration: float, language: str, model: str):
         """
@@ -392,10 +438,14 @@ class MainWindow(QMainWindow):
                 model_used=model
             )
 
-            # Refresh history panel (it will load from database)
-            self.history_panel.load_history()
+            # Prepend just the new row instead of rebuilding the history list
+            rows = self.db.get_recent_transcriptions(limit=1)
+            if rows and rows[0]['id'] == transcription_id:
+                self.history_panel.append_transcription(rows[0])
+            else:
+                self.history_panel.load_history()
 
-            logger.info(f"Added transcription ID {transcription_id} to history")
+            logger.info("Added transcription ID %s to history", transcription_id)
 
         except Exception as e:
             logger.error(f"Failed to add transcription: {e}")
@@ -403,22 +453,18 @@ class MainWindow(QMainWindow):
     def show_history(self):
         """Switch to history panel"""
         self.sidebar.setCurrentRow(0)
-        self.stack.setCurrentIndex(0)
 
     def show_file_transcribe(self):
         """Switch to file transcribe panel"""
         self.sidebar.setCurrentRow(1)
-        self.stack.setCurrentIndex(1)
 
     def show_settings(self):
         """Switch to settings panel"""
-        self.sidebar.setCurrentRow(2)
-        self.stack.setCurrentIndex(2)
+        self.sidebar.setCurrentRow(3)
 
     def show_about(self):
         """Switch to about panel"""
-        self.sidebar.setCurrentRow(3)
-        self.stack.setCurrentIndex(3)
+        self.sidebar.setCurrentRow(4)
 
     def _on_file_transcribed(self, result: dict):
         """Handle file transcription completion"""
@@ -435,7 +481,8 @@ class MainWindow(QMainWindow):
             if add_to_history:
                 self.history_panel.load_history()
 
-            logger.info(f"File transcription completed: {duration:.1f}s, {language}, {text_len} chars")
+            logger.info("File transcription completed: %.1fs, %s, %d chars",
+                        duration, language, text_len)
         except Exception as e:
             logger.error(f"Error handling file transcription completion: {e}")
 
@@ -443,25 +490,18 @@ class MainWindow(QMainWindow):
         """
         Update status bar message
 
+        The label is refreshed on the next status timer tick, so rapid
+        successive updates only cause a single repaint.
+
         Args:
             message: Status message (e.g., "Ready", "Recording", "Processing")
         """
-        # Color-code by status
-        color_map = {
-            "Ready": "#00ff00",
-            "Recording": "#ff9900",
-            "Processing": "#ffff00",
-            "Error": "#ff0000"
-        }
-
-        # Determine color
-        color = "#cccccc"  # Default
-        for key, value in color_map.items():
-                color = value
-                break
-
-        self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        if message == self._last_status_text:
+            return
+        self._last_status_text = message
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
     def update_vram_usage(self, usage_mb: float):
         """
@@ -470,11 +510,39 @@ class MainWindow(QMainWindow):
         Args:
             usage_mb: VRAM usage in megabytes
         """
-        if usage_mb >= 1024:
-            usage_gb = usage_mb / 1024
-            self.vram_label.setText(f"VRAM: {usage_gb:.2f} GB")
+        if usage_mb >= 1024.0:
+            text = "%.2f GB" % (usage_mb * _MB_TO_GB)
         else:
-            self.vram_label.setText(f"VRAM: {usage_mb:.0f} MB")
+            text = "%.0f MB" % usage_mb
+
+        # Steady-state polls usually produce the same text; skip them
+        if text == self._last_vram_text:
+            return
+        self._last_vram_text = text
+        self._pending_vram = text
+
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Write pending status and VRAM values to the status bar labels"""
+        if self._pending_status is not None:
+            message = self._pending_status
+            self._pending_status = None
+
+            self.status_label.setText(message)
+
+            # Color-code by status; re-applying an identical sheet still
+            # makes Qt re-resolve the label's style, so skip it
+            style = _STATUS_STYLE.get(message, _DEFAULT_STATUS_STYLE)
+            if style != self._last_status_style:
+                self._last_status_style = style
+                self.status_label.setStyleSheet(style)
+
+        if self._pending_vram is not None:
+            self._vram_text = self._pending_vram
+            self._pending_vram = None
+            self._refresh_stats_label()
 
     def _load_history(self):
         """Load initial history from database"""
@@ -534,4 +602,44 @@ class MainWindow(QMainWindow):
                 background-color: transparent;
                 padding: 2px 8px;
             }
+
+            QLabel#statusStats {
+                color: #cccccc;
+                margin-left: 16px;
+            }
+
+            QLabel#aboutTitle {
+                font-size: 32px;
+                font-weight: bold;
+                color: #ffffff;
+            }
+
+            QLabel#aboutVersion {
+                font-size: 16px;
+                color: #888888;
+                margin-top: 8px;
+            }
+
+            QLabel#aboutDescription {
+                font-size: 14px;
+                color: #cccccc;
+                margin-top: 16px;
+            }
+
+            QLabel#aboutLicense {
+                font-size: 12px;
+                color: #666666;
+                margin-top: 24px;
+            }
+
+            QLabel#placeholderTitle {
+                font-size: 24px;
+                font-weight: bold;
+                color: #ffffff;
+            }
+
+            QLabel#placeholderMessage {
+                font-size: 14px;
+                color: #888888;
+            }
         """)
@@ -12,22 +12,66 @@ License: MIT
 """
 
 from enum import Enum
+from functools import lru_cache
 import math
 import os
-import time
+import numpy as np
 from PySide6.QtWidgets import QWidget, QApplication, QLabel, QVBoxLayout
-from PySide6.QtGui import QPainter, QColor, QPainterPath, QFont, QFontMetrics, QCursor
+from PySide6.QtGui import (
+    QPainter, QColor, QPainterPath, QFont, QFontMetrics, QCursor, QPen, QBrush, QImage, QPixmap,
+    QStaticText, QTextOption, QTransform
+)
 from PySide6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QRect, QSize, QPoint,
-    QEasingCurve, Signal, QParallelAnimationGroup, Property, QEvent
+    Qt, QTimer, QPropertyAnimation, QVariantAnimation, QRect, QRectF, QLineF, QSize, QPoint, QPointF,
+    QEasingCurve, Signal, Property, QEvent
 )
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import logging
 
 from app.ui.waveform_painter import WaveformPainter
 
 logger = logging.getLogger(__name__)
 
+# Opacity changes smaller than this are not visible (under half an 8-bit step)
+_OPACITY_EPSILON = 1.0 / 512.0
+
+# Number of waveform bars drawn in LISTENING mode, and their geometry
+_WAVEFORM_BARS = 22
+_WAVEFORM_BAR_WIDTH = 4
+_WAVEFORM_BAR_SPACING = 5
+_WAVEFORM_MIN_HEIGHT = 4
+
+
+@lru_cache(maxsize=8)
+def _bucket_offsets(size: int) -> np.ndarray:
+    """Start offsets splitting ``size`` samples into _WAVEFORM_BARS buckets."""
+    return np.linspace(0, size, _WAVEFORM_BARS, endpoint=False).astype(np.intp)
+
+
+def _font_key(font: QFont) -> Tuple[str, int, int, bool]:
+    """Hashable identity of a QFont for measurement caching."""
+    return (font.family(), font.pointSize(), int(font.weight()), font.italic())
+
+
+@lru_cache(maxsize=256)
+def _measure(font_key: Tuple[str, int, int, bool], text: str, width: int) -> Tuple[int, int, str]:
+    """Return (width, height, text) for text elided to fit width in the font."""
+    family, point_size, weight, italic = font_key
+    font = QFont(family, point_size)
+    font.setWeight(QFont.Weight(weight))
+    font.setItalic(italic)
+    metrics = QFontMetrics(font)
+    elided = metrics.elidedText(text, Qt.ElideRight, width)
+    return metrics.horizontalAdvance(elided), metrics.height(), elided
+
+
+# Processing spinner opacity (0.2 to 1.0) over one 60-tick sine period
+_SPINNER_STEPS = 60
+_SPINNER_LUT = [
+    0.2 + 0.8 * (0.5 * (1 + math.sin(2 * math.pi * i / _SPINNER_STEPS)))
+    for i in range(_SPINNER_STEPS)
+]
+
 
 class OverlayMode(Enum):
     """
@@ -51,6 +95,21 @@ class OverlayMode(Enum):
     STATUS = 6      # interactive info (Model, VRAM, etc.)
 
 
+# Modes whose content does not change from frame to frame, so a rendered
+# card can be reused across opacity animation steps
+_CACHED_MODES = frozenset({
+    OverlayMode.MINIMAL,
+    OverlayMode.RESULT,
+    OverlayMode.COPIED,
+    OverlayMode.STATUS,
+})
+
+# Modes that return to HIDDEN on their own (after _auto_dismiss_ms, or
+# _STATUS_DISMISS_MS for the STATUS card)
+_AUTO_DISMISS_MODES = frozenset({OverlayMode.RESULT, OverlayMode.COPIED, OverlayMode.STATUS})
+_STATUS_DISMISS_MS = 4000
+
+
 class DynamicIslandOverlay(QWidget):
     """
     Always-on-top overlay window with Dynamic Island animations.
@@ -69,6 +128,11 @@ class DynamicIslandOverlay(QWidget):
         - Translucent background with rounded corners
         - Positioned at screen top-center
 
+    Painting:
+        State setters must request repaints with update() (ideally with a
+        dirty rect), never repaint(), so Qt can coalesce them. Timer-driven
+        updates are skipped while the overlay is hidden.
+
     Example:
         >>> app = QApplication([])
         >>> overlay = DynamicIslandOverlay()
@@ -81,17 +145,16 @@ class DynamicIslandOverlay(QWidget):
     cancel_requested = Signal()  # User clicked 'X'
     stop_requested = Signal()    # User clicked 'Stop' button
 
-    # Mode configurations: (width, height, opacity)
-    MODE_CONFIGS = {
-        OverlayMode.HIDDEN: (0, 0, 0.0),
-        OverlayMode.HIDDEN: (0, 0, 0.0),
-        OverlayMode.MINIMAL: (30, 30, 0.4),     # Tiny dot when idle
-        OverlayMode.LISTENING: (320, 50, 1.0),  # Compact recording bar
-        OverlayMode.PROCESSING: (200, 50, 0.9), # Compact processing pill
-        OverlayMode.RESULT: (600, 160, 1.0),    # Taller for better text fit
-        OverlayMode.COPIED: (200, 50, 0.9),
-        OverlayMode.STATUS: (300, 100, 0.95),   # Info card
-    }
+    # Mode configurations: (width, height, opacity), indexed by OverlayMode.value
+    _MODE_WH = (
+        (0, 0, 0.0),        # HIDDEN
+        (30, 30, 0.4),      # MINIMAL: Tiny dot when idle
+        (320, 50, 1.0),     # LISTENING: Compact recording bar
+        (200, 50, 0.9),     # PROCESSING: Compact processing pill
+        (600, 160, 1.0),    # RESULT: Taller for better text fit
+        (200, 50, 0.9),     # COPIED
+        (300, 100, 0.95),   # STATUS: Info card
+    )
 
     def __init__(self):
         """
@@ -106,45 +169,145 @@ class DynamicIslandOverlay(QWidget):
         super().__init__()
 
         # State
-        self._mode = OverlayMode.HIDDEN
-        self._waveform_data: List[float] = []
-        self._result_text = ""
-        self._result_language = ""  # New: Store detected language
+        self._mode: OverlayMode = OverlayMode.HIDDEN
+        # Waveform bars live in two preallocated buffers: updates are written
+        # into the back buffer and swapped in only when they differ
+        self._wf_buf = np.zeros(_WAVEFORM_BARS, dtype=np.float32)
+        self._wf_back = np.zeros(_WAVEFORM_BARS, dtype=np.float32)
+        self._wf_len = 0
+        # Waveform strip raster, reallocated only when the strip size changes
+        # and redrawn only when the bars change
+        self._waveform_img: Optional[QImage] = None
+        self._waveform_img_stale = True
+        # Whole-pixel bar heights covered by the last waveform repaint request
+        # (None: unknown, the next update repaints the whole strip)
+        self._wf_painted: Optional[np.ndarray] = None
+        self._result_text: str = ""
+        self._result_language: str = ""  # New: Store detected language
+        self._result_language_label = ""  # Display form, built in the setter
         self._target_geometry = QRect(0, 0, 0, 0)
         self._position_setting = "top-center"   # Default to top-center
         self._monitor_setting = 0
         self._auto_dismiss_ms = 1000            # Default auto-dismiss (1 second)
-        self._content_opacity = 0.0             # Use paint-based opacity (Wayland-safe)
+        self._content_opacity: float = 0.0      # Use paint-based opacity (Wayland-safe)
+        self._painted_opacity: float = 0.0      # Opacity at the last requested repaint
         
         # Status info
         self._model_name = "Unknown"
         self._device_name = "CPU"
         self._vram_usage = "0 MB"
 
-        # Animation
-        self._geometry_animation: Optional[QPropertyAnimation] = None
-        self._opacity_animation: Optional[QPropertyAnimation] = None
-        self._animation_group: Optional[QParallelAnimationGroup] = None
+        # Animation (long-lived; each transition only restarts them with new values)
+        self._geometry_animation = QPropertyAnimation(self, b"geometry", self)
+        self._opacity_anim = QVariantAnimation(self)
+        self._opacity_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._opacity_anim.valueChanged.connect(self._set_content_opacity)
+        self._opacity_anim.finished.connect(self._on_opacity_finished)
+        # Callback run once the current fade finishes
+        self._opacity_done: Optional[Callable[[], None]] = None
 
         # Timers
         self._auto_dismiss_timer = QTimer()
         self._auto_dismiss_timer.setSingleShot(True)
         self._auto_dismiss_timer.timeout.connect(self._on_auto_dismiss)
 
-        # Animation timer (30 FPS) for waveform and UI animations
+        # Animation timer (30 FPS) for the processing spinner
         self._animation_timer = QTimer()
+        self._animation_timer.setInterval(33)
         self._animation_timer.timeout.connect(self._on_animation_tick)
         
-        # Blink timer for recording indicator
-        self._blink_timer = QTimer()
-        self._blink_timer.setInterval(800)  # 800ms blink cycle
-        self._blink_timer.timeout.connect(self._on_blink_tick)
-        self._blink_state = True
+        # Content painters by mode (LISTENING is dispatched separately)
+        self._paint_handlers = {
+            OverlayMode.MINIMAL: self._paint_minimal,
+            OverlayMode.PROCESSING: self._paint_processing,
+            OverlayMode.RESULT: self._paint_result,
+            OverlayMode.COPIED: self._paint_copied,
+            OverlayMode.STATUS: self._paint_status,
+        }
+
+        # Click handlers by mode; each returns True if it consumed the click
+        self._press_handlers = {
+            OverlayMode.LISTENING: self._press_listening,
+            OverlayMode.RESULT: self._press_result,
+            OverlayMode.MINIMAL: self._press_minimal,
+            OverlayMode.STATUS: self._press_status,
+        }
+
+        # Hover handling, coalesced from input rate to ~60 Hz
+        self._pending_mouse_pos: Optional[QPoint] = None
+        self._hovered = False
+        self._hover_timer = QTimer()
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._apply_hover)
+
+        # Deferred Wayland geometry re-apply (coalesces bursts of transitions)
+        self._pending_wayland_geo: Optional[QRect] = None
+        self._wayland_geo_timer = QTimer()
+        self._wayland_geo_timer.setSingleShot(True)
+        self._wayland_geo_timer.setInterval(50)
+        self._wayland_geo_timer.timeout.connect(self._apply_pending_wayland_geometry)
+
         
         # Button geometries (calculated in paint)
         self._copy_btn_rect: Optional[QRect] = None
         self._cancel_btn_rect: Optional[QRect] = None
         self._stop_btn_rect: Optional[QRect] = None
+        self._waveform_rect: Optional[QRect] = None
+        # Click targets as (left, top, right, bottom), right/bottom exclusive;
+        # refreshed together with the button geometry on size changes
+        self._hit_regions: Dict[str, Tuple[int, int, int, int]] = {}
+        # Padded text area used by _paint_text when no rect is given
+        self._default_text_rect: Optional[QRect] = None
+        # LISTENING layout, recomputed only when the size changes
+        self._listening_size: Optional[Tuple[int, int]] = None
+        self._stop_circle_path = QPainterPath()
+        self._stop_square_path = QPainterPath()
+        self._cancel_x_lines: List[QLineF] = []
+
+        # Paint resources, built once instead of on every paintEvent
+        self._font_title = QFont("Inter", 12, QFont.Bold)
+        self._font_body = QFont("Inter", 14, QFont.Normal)
+        self._font_small = QFont("Inter", 10, QFont.Medium)
+        self._font_details = QFont("Inter", 11, QFont.Normal)
+        self._font_text = QFont("Inter", 16, QFont.Medium)
+        self._col_white = QColor(255, 255, 255)
+        self._col_white_100 = QColor(255, 255, 255, 100)
+        self._col_white_150 = QColor(255, 255, 255, 150)
+        self._col_white_200 = QColor(255, 255, 255, 200)
+        self._col_bg = QColor(0, 0, 0, 217)
+        self._col_border = QColor(255, 255, 255, 26)  # 10% opacity = 26/255
+        self._col_cancel_gray = QColor(128, 128, 128, 150)
+        self._col_stop_red = QColor(255, 59, 48)
+        self._col_btn_bg = QColor(255, 255, 255, 30)
+        self._pen_border = QPen(self._col_border)
+        self._brush_white = QBrush(self._col_white)
+        self._pen_cancel_x = QPen(self._col_white, 2)
+        self._pen_cancel_x.setCapStyle(Qt.RoundCap)
+        self._brush_cancel_gray = QBrush(self._col_cancel_gray)
+        self._brush_stop_red = QBrush(self._col_stop_red)
+        self._spinner_colors = [
+            QColor(255, 255, 255, int(255 * opacity)) for opacity in _SPINNER_LUT
+        ]
+        self._spinner_phase: int = 0
+        self._spinner_size: Optional[Tuple[int, int]] = None
+        self._spinner_points: Tuple[QPoint, ...] = ()
+        self._spinner_rect: Optional[QRect] = None
+
+        # Rendered chrome (background + static controls), keyed by
+        # (mode, width, height, device pixel ratio)
+        self._chrome_cache: Dict[Tuple[OverlayMode, int, int, float], QPixmap] = {}
+        # Background silhouette for the current size (dropped on resize)
+        self._pill_path: Optional[QPainterPath] = None
+        # Fully rendered card for static modes (see _CACHED_MODES)
+        self._content_pix: Optional[QPixmap] = None
+
+        # Pre-laid text blocks, rebuilt only when their text changes
+        self._result_static = QStaticText()
+        self._status_static = QStaticText()
+        # Shaped single-line labels, keyed by (text, QFont.key())
+        self._static_cache: Dict[Tuple[str, str], QStaticText] = {}
+        self._prepare_status_text()
 
         # Setup window properties
         self._setup_window()
@@ -172,6 +335,12 @@ class DynamicIslandOverlay(QWidget):
         geometry directly instead.
         """
         self._is_wayland = os.environ.get('XDG_SESSION_TYPE', '') == 'wayland'
+        # Hide immediately instead of fading out on Wayland, where the fade
+        # only produces a burst of invisible repaints (WHISPER_FREE_FAST_HIDE=0
+        # restores the fade)
+        self._fast_hide = (
+            self._is_wayland and os.environ.get('WHISPER_FREE_FAST_HIDE', '1') == '1'
+        )
 
         flags = (
             Qt.FramelessWindowHint |
@@ -222,66 +391,68 @@ class DynamicIslandOverlay(QWidget):
 
         old_mode = self._mode
         self._mode = mode
+        self._invalidate_content_cache()
 
         logger.info(f"Mode transition: {old_mode.name} → {mode.name}")
 
-        # Stop auto-dismiss timer from previous mode
-        if self._auto_dismiss_timer.isActive():
-            self._auto_dismiss_timer.stop()
+        # Coalesce every repaint requested while switching (timers, resize,
+        # show) into the single full update issued when updates are re-enabled
+        self.setUpdatesEnabled(False)
+        try:
+            # Stop timers the new mode does not use. Modes that use them restart
+            # them below (QTimer.start() on an active timer restarts it), so a
+            # stop followed by a start is skipped.
+            if mode not in _AUTO_DISMISS_MODES and self._auto_dismiss_timer.isActive():
+                self._auto_dismiss_timer.stop()
 
-        # Stop animation timer
-        if self._animation_timer.isActive():
-            self._animation_timer.stop()
+            if mode != OverlayMode.PROCESSING and self._animation_timer.isActive():
+                self._animation_timer.stop()
 
-        # Get target configuration
-        target_width, target_height, target_opacity = self.MODE_CONFIGS[mode]
+            # Get target configuration
+            target_width, target_height, target_opacity = self._MODE_WH[mode.value]
 
-        # Calculate target geometry
-        target_geometry = self._calculate_geometry(target_width, target_height)
+            # Calculate target geometry
+            target_geometry = self._calculate_geometry(target_width, target_height)
 
-        if self._is_wayland:
-            # On Wayland: set geometry directly (no animation) to avoid
-            # Mutter auto-hiding the Tool window during geometry transitions.
-            # Only animate opacity for visual smoothness.
-            if mode == OverlayMode.HIDDEN:
-                self._animate_opacity_only(target_opacity, on_done=self.hide)
+            if self._is_wayland:
+                # On Wayland: set geometry directly (no animation) to avoid
+                # Mutter auto-hiding the Tool window during geometry transitions.
+                # Only animate opacity for visual smoothness.
+                if mode == OverlayMode.HIDDEN:
+                    self._animate_opacity_only(target_opacity, on_done=self.hide)
+                else:
+                    self._apply_geometry_wayland(target_geometry)
+                    self._animate_opacity_only(target_opacity)
+                    self.show()
+                    self.raise_()
             else:
-                self._apply_geometry_wayland(target_geometry)
-                self._animate_opacity_only(target_opacity)
-                self.show()
-                self.raise_()
-        else:
-            # On X11: full geometry + opacity animation
-            if old_mode == OverlayMode.HIDDEN:
-                start_geo = QRect(target_geometry)
-                start_geo.setWidth(0)
-                start_geo.setHeight(0)
-                start_geo.moveCenter(target_geometry.center())
-                self.setGeometry(start_geo)
-
-            self._animate_to_geometry(target_geometry, target_opacity)
-
-        # Start mode-specific timers
-        if mode == OverlayMode.RESULT:
-            self._auto_dismiss_timer.start(self._auto_dismiss_ms)
-        elif mode == OverlayMode.COPIED:
-            self._auto_dismiss_timer.start(self._auto_dismiss_ms)
-        elif mode == OverlayMode.LISTENING:
-            # Start animation timer for waveform
-            self._animation_timer.start(33)
-            # Start blink timer
-            self._blink_timer.start()
-            self._blink_state = True
-        elif mode == OverlayMode.PROCESSING:
-             # Start animation timer for spinner
-             self._animation_timer.start(33)
+                # On X11: full geometry + opacity animation
+                if old_mode == OverlayMode.HIDDEN:
+                    start_geo = QRect(target_geometry)
+                    start_geo.setWidth(0)
+                    start_geo.setHeight(0)
+                    start_geo.moveCenter(target_geometry.center())
+                    self.setGeometry(start_geo)
+
+                self._animate_to_geometry(target_geometry, target_opacity)
+
+            # Start mode-specific timers
+            if mode in _AUTO_DISMISS_MODES:
+                if mode == OverlayMode.STATUS:
+                    self._auto_dismiss_timer.start(_STATUS_DISMISS_MS)
+                else:
+                    self._auto_dismiss_timer.start(self._auto_dismiss_ms)
+            elif mode == OverlayMode.PROCESSING:
+                 # Start animation timer for spinner
+                 # (LISTENING needs none: update_waveform drives its repaints)
+                 if not self._animation_timer.isActive():
+                     self._animation_timer.start()
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Emit signal
         self.mode_changed.emit(mode)
 
-        # Trigger repaint
-        self.update()
-
     def set_position(self, position: str = "top-center", monitor_index: int = 0) -> None:
         """
         Set overlay position on screen.
@@ -295,7 +466,7 @@ class DynamicIslandOverlay(QWidget):
         self._monitor_setting = monitor_index
 
         # Recalculate geometry for current mode
-        width, height, _ = self.MODE_CONFIGS[self._mode]
+        width, height, _ = self._MODE_WH[self._mode.value]
         target_geometry = self._calculate_geometry(width, height)
 
         # Apply immediately if visible
@@ -372,71 +543,84 @@ class DynamicIslandOverlay(QWidget):
             easing: Animation curve type
         """
         # Stop any running animations
-        if self._animation_group and self._animation_group.state() == QParallelAnimationGroup.Running:
-            self._animation_group.stop()
-
-        # Create animation group
-        self._animation_group = QParallelAnimationGroup()
+        self._stop_animations()
 
         # Geometry animation
-        self._geometry_animation = QPropertyAnimation(self, b"geometry")
         self._geometry_animation.setDuration(duration)
         self._geometry_animation.setStartValue(self.geometry())
         self._geometry_animation.setEndValue(target_geometry)
         self._geometry_animation.setEasingCurve(easing)
 
-        # Opacity animation (paint-based, Wayland-safe)
-        self._opacity_animation = QPropertyAnimation(self, b"contentOpacity")
-        self._opacity_animation.setDuration(duration)
-        self._opacity_animation.setStartValue(self._content_opacity)
-        self._opacity_animation.setEndValue(target_opacity)
-        self._opacity_animation.setEasingCurve(easing)
-
-        # Add to group
-        self._animation_group.addAnimation(self._geometry_animation)
-        self._animation_group.addAnimation(self._opacity_animation)
-
-        # Start animation
-        self._animation_group.start()
+        # Opacity animation (paint-based, Wayland-safe), same duration so both
+        # legs finish together; hide after it completes when going HIDDEN
+        on_done = self.hide if self._mode == OverlayMode.HIDDEN else None
+        self._start_opacity_animation(target_opacity, duration, easing, on_done)
+        self._geometry_animation.start()
 
         # Show window if hidden
         if not self.isVisible() and self._mode != OverlayMode.HIDDEN:
             self.show()
-        elif self._mode == OverlayMode.HIDDEN:
-            # Hide after animation completes
-            self._animation_group.finished.connect(self.hide)
 
-    def _animate_opacity_only(self, target_opacity: float, duration: int = 300, on_done=None) -> None:
+    def _animate_opacity_only(self, target_opacity: float, duration: int = 300, on_done: Optional[Callable[[], None]] = None) -> None:
         """
         Animate only opacity (used on Wayland where geometry animation
         causes the compositor to auto-hide Tool windows).
         """
-        if self._animation_group and self._animation_group.state() == QParallelAnimationGroup.Running:
-            self._animation_group.stop()
+        self._stop_animations()
 
-        self._opacity_animation = QPropertyAnimation(self, b"contentOpacity")
-        self._opacity_animation.setDuration(duration)
-        self._opacity_animation.setStartValue(self._content_opacity)
-        self._opacity_animation.setEndValue(target_opacity)
-        self._opacity_animation.setEasingCurve(QEasingCurve.OutCubic)
+        if self._fast_hide and target_opacity <= 0.0:
+            self._content_opacity = 0.0
+            self._painted_opacity = 0.0
+            if on_done:
+                on_done()
+            return
 
-        if on_done:
-            self._opacity_animation.finished.connect(on_done)
+        self._start_opacity_animation(target_opacity, duration, QEasingCurve.OutCubic, on_done)
 
-        self._opacity_animation.start()
+    def _start_opacity_animation(
+        self,
+        target_opacity: float,
+        duration: int,
+        easing: QEasingCurve.Type,
+        on_done: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Restart the shared opacity animation from the current opacity."""
+        self._opacity_done = on_done
+        self._opacity_anim.setDuration(duration)
+        self._opacity_anim.setStartValue(self._content_opacity)
+        self._opacity_anim.setEndValue(float(target_opacity))
+        self._opacity_anim.setEasingCurve(easing)
+        self._opacity_anim.start()
+
+    def _stop_animations(self) -> None:
+        """Stop running animations and drop any pending completion callback."""
+        self._opacity_done = None
+        self._geometry_animation.stop()
+        self._opacity_anim.stop()
+
+    def _on_opacity_finished(self) -> None:
+        """Run the completion callback of the fade that just finished."""
+        callback, self._opacity_done = self._opacity_done, None
+        if callback:
+            callback()
 
     def _apply_geometry_wayland(self, target_geometry: QRect) -> None:
         """
         Best-effort positioning on Wayland (GNOME Mutter).
         Re-apply geometry after show to improve compositor compliance.
         """
-        self.setGeometry(target_geometry)
-        handle = self.windowHandle()
-        if handle:
-            handle.setPosition(target_geometry.topLeft())
-        # Re-apply after the surface is mapped
-        QTimer.singleShot(0, lambda tg=QRect(target_geometry): self._apply_geometry_wayland_once(tg))
-        QTimer.singleShot(50, lambda tg=QRect(target_geometry): self._apply_geometry_wayland_once(tg))
+        self._apply_geometry_wayland_once(target_geometry)
+        # Re-apply once after the surface is mapped; repeated calls before the
+        # timer fires only replace the pending geometry
+        self._pending_wayland_geo = QRect(target_geometry)
+        if not self._wayland_geo_timer.isActive():
+            self._wayland_geo_timer.start()
+
+    def _apply_pending_wayland_geometry(self) -> None:
+        """Apply the latest geometry queued by _apply_geometry_wayland."""
+        target_geometry, self._pending_wayland_geo = self._pending_wayland_geo, None
+        if target_geometry is not None:
+            self._apply_geometry_wayland_once(target_geometry)
 
     def _apply_geometry_wayland_once(self, target_geometry: QRect) -> None:
         """Single-shot geometry set used by _apply_geometry_wayland."""
@@ -450,19 +634,28 @@ class DynamicIslandOverlay(QWidget):
 
     def _set_content_opacity(self, value: float) -> None:
         self._content_opacity = max(0.0, min(1.0, float(value)))
+        # Skip repaints for steps too small to see, measured against the last
+        # repainted value so small steps still add up; the ends always repaint
+        if (abs(self._content_opacity - self._painted_opacity) < _OPACITY_EPSILON
+                and self._content_opacity not in (0.0, 1.0)):
+            return
+        self._painted_opacity = self._content_opacity
         self.update()
 
     contentOpacity = Property(float, _get_content_opacity, _set_content_opacity)
 
-    def update_waveform(self, levels: List[float]) -> None:
+    def update_waveform(self, levels: Union[Sequence[float], np.ndarray]) -> None:
         """
         Update waveform data for LISTENING mode.
 
         Args:
-            levels: List of 30-50 float values (0.0-1.0) representing audio levels
+            levels: 30-50 float values (0.0-1.0) representing audio levels,
+                    as a list or numpy array
 
         The waveform is updated in real-time during recording. Values should
-        represent RMS audio levels normalized to the 0.0-1.0 range.
+        represent RMS audio levels normalized to the 0.0-1.0 range. Longer
+        inputs are reduced to one peak per bar (max over each bucket), so the
+        painter only iterates the bars it draws.
 
         This method is thread-safe and can be called from the audio thread.
 
@@ -471,11 +664,84 @@ class DynamicIslandOverlay(QWidget):
             >>> levels = recorder.get_waveform_data()
             >>> overlay.update_waveform(levels)
         """
-        self._waveform_data = list(levels) if levels else []
+        if levels is None or len(levels) == 0:
+            if self._wf_len == 0:
+                return
+            self._wf_len = 0
+        else:
+            samples = np.asarray(levels, dtype=np.float32)
+            back = self._wf_back
+            if samples.size > _WAVEFORM_BARS:
+                count = _WAVEFORM_BARS
+                np.maximum.reduceat(samples, _bucket_offsets(samples.size), out=back)
+            else:
+                count = samples.size
+                np.copyto(back[:count], samples)
 
-        # Only repaint if in LISTENING mode
-        if self._mode == OverlayMode.LISTENING:
+            if count == self._wf_len and np.array_equal(back[:count], self._wf_buf[:count]):
+                return
+            self._wf_buf, self._wf_back = back, self._wf_buf
+            self._wf_len = count
+        self._waveform_img_stale = True
+
+        # Only repaint if in LISTENING mode, and only the waveform strip once
+        # its geometry is known
+        if self._mode == OverlayMode.LISTENING and self.isVisible():
+            if self._waveform_rect is not None and self._waveform_rect.isValid():
+                self._update_waveform_bars()
+                return
             self.update()
+        # Nothing tracks what is on screen now
+        self._wf_painted = None
+
+    def _waveform_bar_heights(self) -> Optional[np.ndarray]:
+        """
+        Whole-pixel bar heights the painter draws for the current levels,
+        or None when no bars are shown.
+        """
+        if self._wf_len == 0:
+            return None
+        span = self._waveform_rect.height() - _WAVEFORM_MIN_HEIGHT
+        heights = np.zeros(_WAVEFORM_BARS, dtype=np.float32)
+        np.clip(self._wf_buf[:self._wf_len], 0.0, 1.0, out=heights[:self._wf_len])
+        heights *= span
+        heights += _WAVEFORM_MIN_HEIGHT
+        return np.rint(heights).astype(np.int32)
+
+    def _update_waveform_bars(self) -> None:
+        """
+        Schedule a repaint of the waveform columns whose whole-pixel bar
+        height differs from the last repaint request (one rect per run of
+        adjacent bars), or of the whole strip when that is unknown.
+
+        Rects get a 1px margin for antialiased bar edges.
+        """
+        strip = self._waveform_rect
+        heights = self._waveform_bar_heights()
+        painted = self._wf_painted
+        if heights is None or painted is None:
+            self._wf_painted = heights
+            self.update(strip.adjusted(-1, -1, 1, 1))
+            return
+
+        # Compared against what was last invalidated rather than the previous
+        # frame, so slow drifts still reach the screen once they add up to a
+        # pixel. Columns whose height is unchanged would repaint identically.
+        changed = np.flatnonzero(heights != painted)
+        if changed.size == 0:
+            return
+        painted[changed] = heights[changed]
+
+        pitch = _WAVEFORM_BAR_WIDTH + _WAVEFORM_BAR_SPACING
+        total_width = _WAVEFORM_BARS * pitch - _WAVEFORM_BAR_SPACING
+        start_x = strip.x() + (strip.width() - total_width) // 2
+
+        # Split the sorted indices into runs of consecutive bars
+        breaks = np.flatnonzero(np.diff(changed) > 1) + 1
+        for run in np.split(changed, breaks):
+            x0 = start_x + int(run[0]) * pitch - 1
+            x1 = start_x + int(run[-1]) * pitch + _WAVEFORM_BAR_WIDTH + 1
+            self.update(QRect(x0, strip.y() - 1, x1 - x0, strip.height() + 2))
 
     def set_result_text(self, text: str, language: str = "") -> None:
         """
@@ -488,9 +754,15 @@ class DynamicIslandOverlay(QWidget):
         # No truncation - let it wrap
         self._result_text = text
         self._result_language = language
+        self._result_language_label = language.title()
+        result_width = self._MODE_WH[OverlayMode.RESULT.value][0] - 40
+        self._result_static = self._make_static_text(
+            text, result_width, self._font_body, QTextOption.WordWrap
+        )
+        self._invalidate_content_cache()
         
         # Calculate needed height? For now use fixed RESULT mode size
-        # Ideally we'd measure text here and adjust MODE_CONFIGS logic
+        # Ideally we'd measure text here and adjust _MODE_WH logic
         # But fixed size with word wrap should cover most short commands/sentences
 
         # Transition to result mode (this starts auto-dismiss timer)
@@ -517,10 +789,38 @@ class DynamicIslandOverlay(QWidget):
         self._model_name = model
         self._device_name = device
         self._vram_usage = vram
+        self._prepare_status_text()
+        self._invalidate_content_cache()
         # Repaint if currently showing status
         if self._mode == OverlayMode.STATUS:
             self.update()
 
+    def _prepare_status_text(self) -> None:
+        """Lay out the STATUS details block for the current status info."""
+        details = f"Model: {self._model_name}\nDevice: {self._device_name}\nVRAM: {self._vram_usage}"
+        status_width = self._MODE_WH[OverlayMode.STATUS.value][0] - 40
+        self._status_static = self._make_static_text(
+            details, status_width, self._font_details, QTextOption.NoWrap
+        )
+
+    @staticmethod
+    def _make_static_text(
+        text: str,
+        width: int,
+        font: QFont,
+        wrap_mode: QTextOption.WrapMode
+    ) -> QStaticText:
+        """Build a plain-text QStaticText laid out once for the given font."""
+        option = QTextOption(Qt.AlignLeft | Qt.AlignTop)
+        option.setWrapMode(wrap_mode)
+
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.PlainText)
+        static_text.setTextOption(option)
+        static_text.setTextWidth(width)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
     def _on_auto_dismiss(self) -> None:
         """
         Handle auto-dismiss timer timeout.
@@ -534,10 +834,15 @@ class DynamicIslandOverlay(QWidget):
     def _on_animation_tick(self) -> None:
         """
         Handle 30 FPS animation tick.
-        Updates waveform or processing animations.
+        Updates the processing animation; the waveform repaints on new data.
         """
-        if self._mode in [OverlayMode.LISTENING, OverlayMode.PROCESSING]:
-            self.update()
+        if self._mode == OverlayMode.PROCESSING and self.isVisible():
+            self._spinner_phase = (self._spinner_phase + 1) % _SPINNER_STEPS
+            # Only the dots change between ticks
+            if self._spinner_rect is not None:
+                self.update(self._spinner_rect)
+            else:
+                self.update()
 
     def paintEvent(self, event):
         """
@@ -549,42 +854,93 @@ class DynamicIslandOverlay(QWidget):
             - Semi-transparent border
 
         The background color is rgba(0, 0, 0, 217) with a subtle white border.
-        All rendering uses antialiasing for smooth appearance.
+        Curved shapes are rendered with antialiasing; pixel-aligned blits of
+        the cached chrome and waveform images are not.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Hot path: read instance state into locals once per paint
+        opacity = self._content_opacity
+        mode = self._mode
+
+        # Don't paint if hidden (checked before any QPainter setup)
+        if opacity <= 0.0:
+            return
 
         # Get widget dimensions
         width = self.width()
         height = self.height()
+        if width == 0 or height == 0:
+            return
 
-        # Don't paint if hidden
-        if width == 0 or height == 0 or self._content_opacity <= 0.0:
+        painter = QPainter(self)
+
+        # Static modes: render the card once, then only blit it; the fade is
+        # applied to that single drawPixmap (no antialiasing needed for a blit)
+        if mode in _CACHED_MODES:
+            content_pix = self._content_pix
+            if content_pix is None:
+                content_pix = self._content_pix = self._render_content(width, height)
+            painter.setOpacity(opacity)
+            painter.drawPixmap(0, 0, content_pix)
             return
 
-        # Apply overall fade without relying on window opacity (Wayland-safe)
-        painter.setOpacity(self._content_opacity)
+        # Only the PROCESSING dots are drawn as shapes here; LISTENING is made
+        # entirely of pixel-aligned image blits, which antialiasing only slows
+        if mode is OverlayMode.PROCESSING:
+            painter.setRenderHint(QPainter.Antialiasing)
 
-        # Draw rounded background
-        self._paint_background(painter, width, height)
+        # Apply overall fade without relying on window opacity (Wayland-safe).
+        # At full opacity leave the painter default so primitives are not
+        # routed through the per-primitive blending path.
+        if opacity < 1.0:
+            painter.setOpacity(opacity)
 
-        # Draw mode-specific content
-        if self._mode == OverlayMode.MINIMAL:
-            self._paint_minimal(painter, width, height)
-        elif self._mode == OverlayMode.LISTENING:
-            self._paint_listening(painter, width, height)
-        elif self._mode == OverlayMode.PROCESSING:
-            self._paint_processing(painter, width, height)
-        elif self._mode == OverlayMode.RESULT:
-            self._paint_result(painter, width, height)
-        elif self._mode == OverlayMode.COPIED:
-            self._paint_copied(painter, width, height)
-        elif self._mode == OverlayMode.STATUS:
-            self._paint_status(painter, width, height)
+        # Draw cached chrome (background plus static controls)
+        self._paint_chrome(painter, width, height)
 
-    def _paint_background(self, painter: QPainter, width: int, height: int) -> None:
+        # Draw mode-specific content, limited to the dirty region
+        self._paint_content(painter, width, height, event.rect())
+
+    def _paint_content(
+        self,
+        painter: QPainter,
+        width: int,
+        height: int,
+        dirty: Optional[QRect] = None
+    ) -> None:
+        """Dispatch to the painter for the current mode."""
+        mode = self._mode
+        if mode is OverlayMode.LISTENING:
+            # Only LISTENING uses the dirty region
+            self._paint_listening(painter, width, height, dirty)
+            return
+
+        paint = self._paint_handlers.get(mode)
+        if paint is not None:
+            paint(painter, width, height)
+
+    def _render_content(self, width: int, height: int) -> QPixmap:
+        """Render background and mode content at full opacity into a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        content_painter = QPainter(pixmap)
+        content_painter.setRenderHint(QPainter.Antialiasing)
+        self._paint_chrome(content_painter, width, height)
+        self._paint_content(content_painter, width, height)
+        content_painter.end()
+
+        return pixmap
+
+    def _invalidate_content_cache(self) -> None:
+        """Drop the rendered card so the next paint rebuilds it."""
+        self._content_pix = None
+
+    def _paint_chrome(self, painter: QPainter, width: int, height: int) -> None:
         """
-        Paint rounded rectangle background with border.
+        Paint rounded rectangle background with border, plus the static
+        controls of the current mode (the LISTENING buttons).
 
         Args:
             painter: QPainter instance
@@ -595,117 +951,254 @@ class DynamicIslandOverlay(QWidget):
             - Fill: rgba(0, 0, 0, 217) [black with 85% opacity]
             - Border: 1px rgba(255, 255, 255, 0.1) [white with 10% opacity]
             - Border radius: 50px (very rounded)
+
+        The chrome only changes with the mode and widget size, so it is
+        rendered once per (mode, size, device pixel ratio) into a pixmap and
+        blitted on later frames; only dynamic content is drawn on top.
         """
-        # Create rounded rectangle path
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, width, height, 16, 16) # Reduced radius from 50 to 16
+        key = (self._mode, width, height, self.devicePixelRatioF())
+        pixmap = self._chrome_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_chrome(self._mode, width, height)
+            self._chrome_cache[key] = pixmap
+        painter.drawPixmap(0, 0, pixmap)
+
+    def _render_chrome(self, mode: OverlayMode, width: int, height: int) -> QPixmap:
+        """Render background, border and static controls into a transparent pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        bg_painter = QPainter(pixmap)
+        bg_painter.setRenderHint(QPainter.Antialiasing)
+
+        # Rounded rectangle path, shared by every mode at this size
+        path = self._pill_path
+        if path is None:
+            path = QPainterPath()
+            path.addRoundedRect(0, 0, width, height, 16, 16) # Reduced radius from 50 to 16
+            self._pill_path = path
 
         # Fill background
-        painter.fillPath(path, QColor(0, 0, 0, 217))
+        bg_painter.fillPath(path, self._col_bg)
 
         # Draw border
-        border_color = QColor(255, 255, 255, 26)  # 10% opacity = 26/255
-        painter.setPen(border_color)
-        painter.drawPath(path)
+        bg_painter.setPen(self._pen_border)
+        bg_painter.drawPath(path)
+
+        if mode == OverlayMode.LISTENING:
+            if self._listening_size != (width, height):
+                self._layout_listening(width, height)
+            self._paint_listening_buttons(bg_painter)
+        bg_painter.end()
+
+        return pixmap
+
+    def resizeEvent(self, event):
+        """Drop cached chrome that no longer matches the widget size."""
+        self._chrome_cache.clear()
+        self._pill_path = None
+        self._default_text_rect = None
+        self._waveform_rect = None
+        self._listening_size = None
+        self._spinner_size = None
+        self._spinner_rect = None
+        self._invalidate_content_cache()
+        super().resizeEvent(event)
+
+    def hideEvent(self, event):
+        """Stop the spinner timer while nothing can be seen."""
+        if self._animation_timer.isActive():
+            self._animation_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume the spinner timer if the overlay reappears mid-PROCESSING."""
+        if self._mode == OverlayMode.PROCESSING and not self._animation_timer.isActive():
+            self._animation_timer.start()
+        super().showEvent(event)
 
     def _paint_minimal(self, painter: QPainter, width: int, height: int) -> None:
         """Paint MINIMAL mode: Tiny confused dot."""
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(255, 255, 255, 100))
+        painter.setBrush(self._col_white_100)
         
         # Draw small circle in center
         radius = 6
         center = QPoint(width // 2, height // 2)
         painter.drawEllipse(center, radius, radius)
 
-    def _paint_listening(self, painter: QPainter, width: int, height: int) -> None:
-        """Paint LISTENING mode: Close Btn | Waveform | Stop Btn."""
+    def _paint_listening(
+        self,
+        painter: QPainter,
+        width: int,
+        height: int,
+        dirty: Optional[QRect] = None
+    ) -> None:
+        """
+        Paint LISTENING mode: Close Btn | Waveform | Stop Btn.
+
+        The buttons are part of the cached chrome (see _paint_chrome), so
+        only the waveform is drawn here, and only if it intersects ``dirty``.
+        """
         
+        if self._listening_size != (width, height):
+            self._layout_listening(width, height)
+
+        # Waveform (Center)
+        # -----------------
+        waveform_rect = self._waveform_rect
+        waveform_width = waveform_rect.width()
+        
+        if (self._wf_len and waveform_width > 0 and self._waveform_img is not None
+                and (dirty is None or dirty.intersects(waveform_rect))):
+            if self._waveform_img_stale:
+                self._paint_waveform_into(self._waveform_img)
+            painter.drawImage(waveform_rect.topLeft(), self._waveform_img)
+
+    def _paint_waveform_into(self, image: QImage) -> None:
+        """Redraw the waveform bars into the strip image."""
+        width = self._waveform_rect.width()
+        height = self._waveform_rect.height()
+
+        image.fill(Qt.transparent)
+        # Bars are blitted on whole pixels, so no antialiasing is needed here
+        image_painter = QPainter(image)
+        WaveformPainter.paint_waveform(
+            image_painter,
+            self._wf_buf[:self._wf_len],
+            QRect(0, 0, width, height),
+            bar_count=_WAVEFORM_BARS, # Reduced bar count to fit smaller width
+            bar_width=_WAVEFORM_BAR_WIDTH,
+            bar_spacing=_WAVEFORM_BAR_SPACING,
+            min_height=_WAVEFORM_MIN_HEIGHT,
+            max_height=height
+        )
+        image_painter.end()
+        self._waveform_img_stale = False
+
+    def _paint_listening_buttons(self, painter: QPainter) -> None:
+        """Paint the LISTENING cancel (left) and stop (right) buttons."""
         # 1. Close/Cancel Button (Left)
         # -----------------------------
-        btn_size = 24  # Slightly smaller
-        padding_x = 10 # Reduced padding
-        center_y = height // 2
-        
-        self._cancel_btn_rect = QRect(padding_x, center_y - btn_size // 2, btn_size, btn_size)
-        
         # Draw Circle Background (Gray)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(128, 128, 128, 150))
+        painter.setBrush(self._brush_cancel_gray)
         painter.drawEllipse(self._cancel_btn_rect)
         
-        # Draw 'X' Icon
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Inter", 12, QFont.Bold))
-        painter.drawText(self._cancel_btn_rect, Qt.AlignCenter, "×")
+        # Draw 'X' Icon as two strokes (no font shaping per frame)
+        painter.setPen(self._pen_cancel_x)
+        painter.drawLines(self._cancel_x_lines)
+        painter.setPen(Qt.NoPen)
 
         # 2. Stop Button (Right)
         # ----------------------
+        # Red circle, then white stop square, from cached paths
+        painter.fillPath(self._stop_circle_path, self._brush_stop_red)
+        painter.fillPath(self._stop_square_path, self._brush_white)
+
+    def _layout_listening(self, width: int, height: int) -> None:
+        """Compute LISTENING button rects, stop-button paths and waveform strip."""
+        btn_size = 24  # Slightly smaller
+        padding_x = 10 # Reduced padding
+        center_y = height // 2
+
+        self._cancel_btn_rect = QRect(padding_x, center_y - btn_size // 2, btn_size, btn_size)
+
+        # 'X' glyph: two diagonals inset into the cancel button
+        cross = QRectF(self._cancel_btn_rect).adjusted(8.5, 8.5, -8.5, -8.5)
+        self._cancel_x_lines = [
+            QLineF(cross.topLeft(), cross.bottomRight()),
+            QLineF(cross.topRight(), cross.bottomLeft()),
+        ]
+
         stop_btn_x = width - padding_x - btn_size
         self._stop_btn_rect = QRect(stop_btn_x, center_y - btn_size // 2, btn_size, btn_size)
 
-        # Draw Circle Background (Red)
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(255, 59, 48)) # Start with Red
-        painter.drawEllipse(self._stop_btn_rect)
-        
-        # Draw Stop Square
+        self._set_hit_region('cancel', self._cancel_btn_rect)
+        self._set_hit_region('stop', self._stop_btn_rect)
+
+        self._stop_circle_path = QPainterPath()
+        self._stop_circle_path.addEllipse(QRectF(self._stop_btn_rect))
+
         square_size = 8
-        square_rect = QRect(
+        square_rect = QRectF(
             stop_btn_x + (btn_size - square_size) // 2,
             center_y - square_size // 2,
             square_size,
             square_size
         )
-        painter.setBrush(QColor(255, 255, 255)) # White
-        painter.drawRoundedRect(square_rect, 2, 2)
+        self._stop_square_path = QPainterPath()
+        self._stop_square_path.addRoundedRect(square_rect, 2, 2)
 
-        # 3. Waveform (Center)
-        # --------------------
         # Space between buttons (tight gap)
         start_x = self._cancel_btn_rect.right() + 6
         end_x = self._stop_btn_rect.left() - 6
-        waveform_width = end_x - start_x
-        
-        if self._waveform_data and waveform_width > 0:
-            waveform_rect = QRect(start_x, 10, waveform_width, height - 20)
-            WaveformPainter.paint_waveform(
-                painter,
-                self._waveform_data,
-                waveform_rect,
-                bar_count=22, # Reduced bar count to fit smaller width
-                bar_width=4,
-                bar_spacing=5,
-                min_height=4,
-                max_height=height - 20
+        self._waveform_rect = QRect(start_x, 10, end_x - start_x, height - 20)
+
+        if self._waveform_rect.width() > 0 and self._waveform_rect.height() > 0:
+            ratio = self.devicePixelRatioF()
+            self._waveform_img = QImage(
+                int(self._waveform_rect.width() * ratio),
+                int(self._waveform_rect.height() * ratio),
+                QImage.Format_ARGB32_Premultiplied
             )
+            self._waveform_img.setDevicePixelRatio(ratio)
+        else:
+            self._waveform_img = None
+        self._waveform_img_stale = True
+        self._wf_painted = None
+
+        self._listening_size = (width, height)
+
+    def _set_hit_region(self, name: str, rect: QRect) -> None:
+        """Store a click target as plain integer bounds."""
+        left, top = rect.x(), rect.y()
+        self._hit_regions[name] = (left, top, left + rect.width(), top + rect.height())
+
+    def _hit(self, name: str, x: int, y: int) -> bool:
+        """Return True if (x, y) lies inside the named click target."""
+        region = self._hit_regions.get(name)
+        return region is not None and region[0] <= x < region[2] and region[1] <= y < region[3]
 
     def _paint_processing(self, painter: QPainter, width: int, height: int) -> None:
         """Paint PROCESSING mode: Animated 3-dot pulse."""
         
-        # Center coordinates
-        center_x = width // 2
-        center_y = height // 2
+        # Dot centers only depend on the widget size
+        if self._spinner_size != (width, height):
+            center_x = width // 2
+            center_y = height // 2
+            spacing = 14
+            self._spinner_points = (
+                QPoint(center_x - spacing, center_y),
+                QPoint(center_x, center_y),
+                QPoint(center_x + spacing, center_y),
+            )
+            # Area covered by the dots (radius 4) plus 1px antialiasing margin
+            self._spinner_rect = QRect(
+                center_x - spacing - 5, center_y - 5, 2 * spacing + 11, 11
+            )
+            self._spinner_size = (width, height)
+        left, middle, right = self._spinner_points
         
         # Dot configuration
         dot_radius = 4
-        spacing = 14
         
-        # Current time for animation phase
-        t = time.time() * 5 # Speed multiplier
+        # Animation phase, advanced by _on_animation_tick
+        phase = self._spinner_phase
+        colors = self._spinner_colors
         
         painter.setPen(Qt.NoPen)
         
-        # Draw 3 dots
-        for i in range(3):
-            # Calculate opacity based on sine wave with offset for each dot
-            # Result is 0.2 to 1.0 opacity
-            opacity = 0.2 + 0.8 * (0.5 * (1 + math.sin(t - i * 0.8)))
-            
-            x = center_x + (i - 1) * spacing
-            
-            painter.setBrush(QColor(255, 255, 255, int(255 * opacity)))
-            painter.drawEllipse(QPoint(x, center_y), dot_radius, dot_radius)
+        # Draw 3 dots, each looking up its opacity (0.2 to 1.0) with a
+        # phase offset of 7 steps from the previous one
+        painter.setBrush(colors[phase % _SPINNER_STEPS])
+        painter.drawEllipse(left, dot_radius, dot_radius)
+        painter.setBrush(colors[(phase - 7) % _SPINNER_STEPS])
+        painter.drawEllipse(middle, dot_radius, dot_radius)
+        painter.setBrush(colors[(phase - 14) % _SPINNER_STEPS])
+        painter.drawEllipse(right, dot_radius, dot_radius)
 
     def _paint_result(self, painter: QPainter, width: int, height: int) -> None:
         """Paint RESULT mode: Transcript + Copy Button."""
@@ -715,23 +1208,23 @@ class DynamicIslandOverlay(QWidget):
         content_rect = QRect(20, 20, width - 40, height - 40)
         
         # Label "Transcription"
-        painter.setPen(QColor(255, 255, 255, 150))
-        painter.setFont(QFont("Inter", 10, QFont.Medium))
-        painter.drawText(content_rect, Qt.AlignLeft | Qt.AlignTop, "Transcription")
+        painter.setPen(self._col_white_150)
+        painter.setFont(self._font_small)
+        self._draw_text(painter, "Transcription", content_rect, Qt.AlignLeft | Qt.AlignTop, self._font_small)
         
         # Label "Language" (Top Right)
-        if self._result_language:
-            painter.drawText(content_rect, Qt.AlignRight | Qt.AlignTop, self._result_language.title())
+        if self._result_language_label:
+            self._draw_text(painter, self._result_language_label, content_rect,
+                            Qt.AlignRight | Qt.AlignTop, self._font_small)
         
         # 2. Main Text
         # ------------
         text_rect = QRect(20, 45, width - 40, height - 85) # Reserve space for button
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Inter", 14, QFont.Normal))
+        painter.setPen(self._col_white)
+        painter.setFont(self._font_body)
         
-        # Draw text with ellipsis if it fails to fit
-        option =  Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
-        painter.drawText(text_rect, option, self._result_text)
+        # Draw the word-wrapped text laid out once in set_result_text
+        painter.drawStaticText(text_rect.topLeft(), self._result_static)
 
         # 3. Copy Button (Bottom Right, Pill Styling)
         # -------------------------------------------
@@ -741,17 +1234,18 @@ class DynamicIslandOverlay(QWidget):
         btn_y = height - btn_height - 20
         
         self._copy_btn_rect = QRect(btn_x, btn_y, btn_width, btn_height)
+        self._set_hit_region('copy', self._copy_btn_rect)
         
         # Determine if hovered (requires mouse tracking, skipping for now)
         # Button Gradient Background
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(255, 255, 255, 30)) # Translucent white
+        painter.setBrush(self._col_btn_bg) # Translucent white
         painter.drawRoundedRect(self._copy_btn_rect, 16, 16)
         
         # Icon + Text
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Inter", 12, QFont.Bold))
-        painter.drawText(self._copy_btn_rect, Qt.AlignCenter, "Copy")
+        painter.setPen(self._col_white)
+        painter.setFont(self._font_title)
+        self._draw_text(painter, "Copy", self._copy_btn_rect, Qt.AlignCenter, self._font_title)
         
         # Optional: Add Copy Icon (simple rects)
         icon_size = 12
@@ -766,16 +1260,15 @@ class DynamicIslandOverlay(QWidget):
     def _paint_status(self, painter: QPainter, width: int, height: int) -> None:
         """Paint STATUS mode: Model and Device info."""
         # Title
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Inter", 12, QFont.Bold))
-        painter.drawText(QRect(20, 15, width-40, 20), Qt.AlignLeft, "Whisper-Free")
+        painter.setPen(self._col_white)
+        painter.setFont(self._font_title)
+        self._draw_text(painter, "Whisper-Free", QRect(20, 15, width-40, 20), Qt.AlignLeft, self._font_title)
         
         # Details
-        painter.setFont(QFont("Inter", 11, QFont.Normal))
-        painter.setPen(QColor(255, 255, 255, 200))
+        painter.setFont(self._font_details)
+        painter.setPen(self._col_white_200)
         
-        details = f"Model: {self._model_name}\nDevice: {self._device_name}\nVRAM: {self._vram_usage}"
-        painter.drawText(QRect(20, 40, width-40, 60), Qt.AlignLeft, details)
+        painter.drawStaticText(QPoint(20, 40), self._status_static)
 
 
     def _paint_text(
@@ -800,84 +1293,176 @@ class DynamicIslandOverlay(QWidget):
             rect: Custom bounding rect
             align: Alignment flags
         """
-        painter.setPen(QColor(255, 255, 255))
-        font = QFont("Inter", font_size, QFont.Medium)
-        painter.setFont(font)
+        painter.setPen(self._col_white)
+        if font_size == 16:
+            font = self._font_text
+        else:
+            font = QFont("Inter", font_size, QFont.Medium)
 
-        # Draw centered text with padding
-        target_rect = rect if rect else QRect(16, 8, width - 32, height - 16)
+        # Draw centered text with padding (default rect is kept per size)
+        if rect is not None:
+            target_rect = rect
+        else:
+            if self._default_text_rect is None:
+                self._default_text_rect = QRect(16, 8, width - 32, height - 16)
+            target_rect = self._default_text_rect
         
-        # Use elided text if no wrapping requested and it overflows?
-        # For now, just draw.
-        painter.drawText(target_rect, align, text)
+        # Overflowing text is elided by _draw_text
+        self._draw_text(painter, text, target_rect, align, font)
+
+    def _draw_text(self, painter: QPainter, text: str, rect: QRect, align, font: QFont) -> None:
+        """
+        Draw a single line of text aligned inside rect.
+
+        Text wider than rect is elided on the right (measurements are cached
+        per font, text and width). The result is shaped once per (text, font)
+        into a cached QStaticText, so repeated paints only position and blit
+        the prepared glyphs.
+        """
+        text = _measure(_font_key(font), text, rect.width())[2]
+        key = (text, font.key())
+        static_text = self._static_cache.get(key)
+        if static_text is None:
+            if len(self._static_cache) >= 64:
+                # Dynamic strings (e.g. languages) should not grow this forever
+                self._static_cache.clear()
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+            static_text.prepare(QTransform(), font)
+            self._static_cache[key] = static_text
+
+        size = static_text.size()
+        if align & Qt.AlignRight:
+            x = rect.x() + rect.width() - size.width()
+        elif align & Qt.AlignHCenter:
+            x = rect.x() + (rect.width() - size.width()) / 2.0
+        else:
+            x = rect.x()
+        if align & Qt.AlignBottom:
+            y = rect.y() + rect.height() - size.height()
+        elif align & Qt.AlignVCenter:
+            y = rect.y() + (rect.height() - size.height()) / 2.0
+        else:
+            y = rect.y()
+
+        painter.setFont(font)
+        painter.drawStaticText(QPointF(x, y), static_text)
+
+    def changeEvent(self, event):
+        """Drop shaped text when fonts change."""
+        if event.type() == QEvent.FontChange:
+            _measure.cache_clear()
+            self._static_cache.clear()
+            self._invalidate_content_cache()
+        super().changeEvent(event)
 
     def mousePressEvent(self, event):
-        """Handle mouse clicks."""
+        """Handle mouse clicks via the per-mode handler table."""
         if event.button() != Qt.LeftButton:
             return
 
-        pos = event.pos()
-
-        # LISTENING Mode Interactions
-        if self._mode == OverlayMode.LISTENING:
-            # Check Cancel Button
-            if self._cancel_btn_rect and self._cancel_btn_rect.contains(pos):
-                self.cancel_requested.emit()
-                event.accept()
-                return
-            
-            # Check Stop Button
-            if self._stop_btn_rect and self._stop_btn_rect.contains(pos):
-                self.stop_requested.emit()
-                event.accept()
-                return
-
-        # RESULT Mode Interactions
-        elif self._mode == OverlayMode.RESULT:
-            if self._copy_btn_rect and self._copy_btn_rect.contains(pos):
-                QApplication.clipboard().setText(self._result_text)
-                self.show_copied_confirmation()
+        handler = self._press_handlers.get(self._mode)
+        if handler is not None:
+            pos = event.pos()
+            if handler(pos.x(), pos.y()):
                 event.accept()
                 return
 
-        # MINIMAL Mode -> Toggle Status
-        elif self._mode == OverlayMode.MINIMAL:
-            self.set_mode(OverlayMode.STATUS)
-            self._auto_dismiss_timer.start(4000)
-            event.accept()
-            return
-            
-        # STATUS Mode -> Toggle Minimal
-        elif self._mode == OverlayMode.STATUS:
-            self.set_mode(OverlayMode.MINIMAL)
-            event.accept()
-            return
-
         super().mousePressEvent(event)
 
+    def _press_listening(self, x: int, y: int) -> bool:
+        """LISTENING: cancel or stop recording."""
+        # Check Cancel Button
+        if self._hit('cancel', x, y):
+            self.cancel_requested.emit()
+            return True
+
+        # Check Stop Button
+        if self._hit('stop', x, y):
+            self.stop_requested.emit()
+            return True
+        return False
+
+    def _press_result(self, x: int, y: int) -> bool:
+        """RESULT: copy the transcript."""
+        if self._hit('copy', x, y):
+            # Show the confirmation first and write the clipboard on the next
+            # event-loop pass; the write may block on X11/Wayland IPC
+            self.show_copied_confirmation()
+            text = self._result_text
+            QTimer.singleShot(0, lambda: QApplication.clipboard().setText(text))
+            return True
+        return False
+
+    def _press_minimal(self, x: int, y: int) -> bool:
+        """MINIMAL: toggle to the status card."""
+        self.set_mode(OverlayMode.STATUS)
+        return True
+
+    def _press_status(self, x: int, y: int) -> bool:
+        """STATUS: toggle back to minimal."""
+        self.set_mode(OverlayMode.MINIMAL)
+        return True
+
     def mouseMoveEvent(self, event):
-        """Standard mouse move."""
+        """
+        Record the pointer position for hover handling.
+
+        Moves arrive at input rate (often >120 Hz); they are only stored here
+        and applied at most once per frame by _apply_hover.
+        """
+        self._pending_mouse_pos = event.pos()
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
         super().mouseMoveEvent(event)
 
+    def _apply_hover(self) -> None:
+        """Update the cursor for the latest pointer position."""
+        pos, self._pending_mouse_pos = self._pending_mouse_pos, None
+        if pos is None:
+            return
+
+        x, y = pos.x(), pos.y()
+        if self._mode == OverlayMode.LISTENING:
+            hovered = self._hit('cancel', x, y) or self._hit('stop', x, y)
+        elif self._mode == OverlayMode.RESULT:
+            hovered = self._hit('copy', x, y)
+        else:
+            # MINIMAL and STATUS toggle on a click anywhere
+            hovered = self._mode in (OverlayMode.MINIMAL, OverlayMode.STATUS)
+
+        if hovered != self._hovered:
+            self._hovered = hovered
+            if hovered:
+                self.setCursor(Qt.PointingHandCursor)
+            else:
+                self.unsetCursor()
+
     def mouseReleaseEvent(self, event):
         """Standard mouse release."""
         super().mouseReleaseEvent(event)
 
-    def _on_blink_tick(self) -> None:
-        """Toggle blink state."""
-        self._blink_state = not self._blink_state
-        if self._mode == OverlayMode.LISTENING:
-            self.update()
-
     @property
     def mode(self) -> OverlayMode:
         """Get current overlay mode."""
         return self._mode
 
     @property
-    def waveform_data(self) -> List[float]:
-        """Get current waveform data."""
-        return self._waveform_data.copy()
+    def waveform_data(self) -> np.ndarray:
+        """
+        Get current waveform bars as a read-only float32 view (no copy).
+
+        The view shares the overlay's buffer and is only meaningful until the
+        next update_waveform call; use waveform_data_list() for a snapshot.
+        """
+        view = self._wf_buf[:self._wf_len].view()
+        view.setflags(write=False)
+        return view
+
+    def waveform_data_list(self) -> List[float]:
+        """Get a copy of the current waveform bars as a list."""
+        return self._wf_buf[:self._wf_len].tolist()
 
     def __repr__(self) -> str:
         """String representation of overlay state."""
@@ -8,21 +8,322 @@ Provides settings interface with:
 - Real-time validation
 """
 
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+import re
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QFormLayout, QHBoxLayout, QComboBox,
+    QWidget, QVBoxLayout, QGridLayout, QHBoxLayout, QLayout, QSizePolicy, QComboBox,
     QCheckBox, QSpinBox, QDoubleSpinBox, QPushButton,
     QLineEdit, QSlider, QLabel, QGroupBox, QScrollArea,
-    QMessageBox, QGridLayout, QFrame
+    QMessageBox, QFrame
+)
+from PySide6.QtCore import (
+    Signal, Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker
 )
-from PySide6.QtCore import Signal, Qt, QEvent
 import logging
 
 from PySide6.QtGui import QStandardItemModel, QStandardItem, QColor, QBrush
-from app.core.audio_capture import AudioRecorder
-from app.core.whisper_engine import WhisperEngine
+
+# app.core.whisper_engine (torch) and app.core.audio_capture (sounddevice)
+# are imported where used, so importing this module stays cheap
 
 logger = logging.getLogger(__name__)
 
+# Stylesheets, built once at import and applied as one sheet on the panel
+_LABEL_STYLE = """
+    QLabel#settingsHeader {
+        font-size: 24px;
+        font-weight: bold;
+        color: #ffffff;
+    }
+    QLabel#deviceLabel {
+        color: #cccccc;
+    }
+    QLabel#vramEstimateLabel {
+        color: #aaaaaa;
+        font-style: italic;
+    }
+    QLabel#vramLabel {
+        color: #888888;
+    }
+    QLabel#dismissLabel {
+        color: #888888;
+        font-size: 12px;
+    }
+    QLabel#saveStatusLabel {
+        color: #4CAF50;
+    }
+"""
+
+_SCROLL_STYLE = """
+    QScrollArea { background-color: transparent; border: none; }
+    QWidget#settingsScrollContent { background-color: transparent; }
+    QScrollBar:vertical {
+        background: #2d2d2d;
+        width: 10px;
+        margin: 0px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical {
+        background: #4d4d4d;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+"""
+
+_GROUP_STYLE = """
+    QGroupBox {
+        border: 1px solid #3d3d3d;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding: 12px;
+        font-weight: bold;
+        color: #ffffff;
+        background-color: #252525;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 8px;
+        background-color: transparent;
+    }
+"""
+
+_COMBO_STYLE = """
+    QComboBox {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px 10px;
+        color: #ffffff;
+        min-width: 200px;
+    }
+    QComboBox:hover {
+        border-color: #0078d4;
+    }
+    QComboBox::drop-down {
+        border: none;
+        padding-right: 8px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        selection-background-color: #0078d4;
+        color: #ffffff;
+    }
+"""
+
+_LINEEDIT_STYLE = """
+    QLineEdit {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px 10px;
+        color: #ffffff;
+    }
+    QLineEdit:focus {
+        border-color: #0078d4;
+    }
+"""
+
+_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: #ffffff;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border-color: #4d4d4d;
+    }
+    QPushButton:pressed {
+        background-color: #4d4d4d;
+    }
+"""
+
+_PRIMARY_BUTTON_STYLE = """
+    QPushButton#primaryButton {
+        background-color: #0078d4;
+        border: 1px solid #0078d4;
+        border-radius: 4px;
+        padding: 10px 24px;
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #005a9e;
+        border-color: #005a9e;
+    }
+    QPushButton#primaryButton:pressed {
+        background-color: #004578;
+    }
+"""
+
+_SPINBOX_STYLE = """
+    QSpinBox, QDoubleSpinBox {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px 10px;
+        color: #ffffff;
+    }
+    QSpinBox:hover, QDoubleSpinBox:hover {
+        border-color: #0078d4;
+    }
+"""
+
+_SLIDER_STYLE = """
+    QSlider::groove:horizontal {
+        background: #3d3d3d;
+        height: 6px;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #0078d4;
+        width: 16px;
+        height: 16px;
+        margin: -5px 0;
+        border-radius: 8px;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #005a9e;
+    }
+"""
+
+_CHECKBOX_STYLE = """
+    QCheckBox {
+        color: #cccccc;
+    }
+"""
+
+# Everything above, matched by selector across the panel; one-off widgets
+# (save button, labels) are singled out by their objectName
+_PANEL_STYLE = (
+    _LABEL_STYLE + _SCROLL_STYLE + _GROUP_STYLE + _COMBO_STYLE
+    + _LINEEDIT_STYLE + _BUTTON_STYLE + _PRIMARY_BUTTON_STYLE
+    + _SPINBOX_STYLE + _SLIDER_STYLE + _CHECKBOX_STYLE
+)
+
+# Hotkey: one or more modifiers (plain or pynput-style <ctrl>) joined by '+',
+# then a key; the modifier names match HotkeyManager._normalize_hotkey
+_HOTKEY_RE = re.compile(
+    r'^(?:<?(?:ctrl|alt|shift|cmd|super)>?\s*\+\s*)+[^\s+]+$',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1)
+def _available_vram() -> float:
+    """Total VRAM of the primary GPU in GB, queried from the driver once."""
+    from app.core.whisper_engine import WhisperEngine
+    return WhisperEngine.get_available_vram()
+
+
+# Transcription languages as (display name, Whisper code), in combo order
+_LANGUAGES = (
+    ('Auto-detect', None),
+    ('English', 'en'),
+    ('Spanish', 'es'),
+    ('French', 'fr'),
+    ('German', 'de'),
+    ('Italian', 'it'),
+    ('Portuguese', 'pt'),
+    ('Dutch', 'nl'),
+    ('Russian', 'ru'),
+    ('Chinese', 'zh'),
+    ('Japanese', 'ja'),
+    ('Korean', 'ko'),
+    ('Tamil', 'ta'),
+)
+# Whisper code -> combo row
+_LANGUAGE_ROWS = {code: row for row, (_, code) in enumerate(_LANGUAGES)}
+
+# Model list entries that need more VRAM than the GPU has
+_DISABLED_BRUSH = QBrush(QColor(0x66, 0x66, 0x66))
+_DISABLED_TOOLTIP_FMT = "Requires ~{} GB VRAM (Available: {:.1f} GB)"
+_MODEL_TOOLTIP_FMT = "Estimated VRAM: ~{} GB"
+
+# Horizontal policies that make a field fill its grid column
+_GROWING_POLICIES = (QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
+
+
+def _add_grid_row(grid: QGridLayout, row: int, label: str, field) -> int:
+    """
+    Add a label/field row to a two-column settings grid and return the next
+    row. Fields are sized like the QFormLayout rows this replaces: only
+    expanding fields (and layouts) fill the field column.
+    """
+    if label:
+        grid.addWidget(QLabel(label), row, 0)
+    if isinstance(field, QLayout):
+        grid.addLayout(field, row, 1)
+    elif field.sizePolicy().horizontalPolicy() in _GROWING_POLICIES:
+        grid.addWidget(field, row, 1)
+    else:
+        grid.addWidget(field, row, 1, Qt.AlignmentFlag.AlignLeft)
+    return row + 1
+
+
+def _stripped_text(edit: QLineEdit) -> str:
+    """Line edit text without surrounding whitespace"""
+    return edit.text().strip()
+
+
+@dataclass(slots=True)
+class _SettingsWidgets:
+    """
+    Input widgets of the settings panel, one attribute per setting.
+    Attributes are assigned as the groups are built.
+    """
+    whisper_model: QComboBox = field(init=False)
+    whisper_language: QComboBox = field(init=False)
+    whisper_device_label: QLabel = field(init=False)
+    vram_label: QLabel = field(init=False)
+    audio_device: QComboBox = field(init=False)
+    audio_noise_reduction: QCheckBox = field(init=False)
+    audio_vad_enabled: QCheckBox = field(init=False)
+    hotkey_primary: QLineEdit = field(init=False)
+    hotkey_fallback: QLineEdit = field(init=False)
+    overlay_enabled: QCheckBox = field(init=False)
+    overlay_position: QComboBox = field(init=False)
+    overlay_monitor: QComboBox = field(init=False)
+    overlay_auto_dismiss_ms: QSlider = field(init=False)
+    whisper_fp16: QCheckBox = field(init=False)
+    whisper_beam_size: QSpinBox = field(init=False)
+    whisper_temperature: QDoubleSpinBox = field(init=False)
+    storage_retention_days: QSpinBox = field(init=False)
+
+    def all(self) -> list:
+        """All widgets assigned so far"""
+        return [getattr(self, f.name) for f in fields(self) if hasattr(self, f.name)]
+
+
+class _DeviceListSignals(QObject):
+    """Signals used to hand the audio device list back to the UI thread"""
+
+    listed = Signal(list)
+    failed = Signal(str)
+
+
+class _DeviceListTask(QRunnable):
+    """Enumerates audio input devices on the thread pool"""
+
+    def __init__(self, signals):
+        super().__init__()
+        self._signals = signals
+
+    def run(self):
+        try:
+            from app.core.audio_capture import AudioRecorder
+            self._signals.listed.emit(AudioRecorder.list_devices())
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+
 
 class SettingsPanel(QWidget):
     """
@@ -34,6 +335,25 @@ class SettingsPanel(QWidget):
     settings_saved = Signal()  # Emitted when settings are saved
     model_changed = Signal(str)  # Emitted when Whisper model is changed
 
+    # Plain settings as (config key, widget attribute, getter, setter, default);
+    # _load_settings and save_settings walk this table, and only settings kept
+    # in combo item data are handled by hand
+    _CONFIG_MAP = (
+        ('whisper.model', 'whisper_model', QComboBox.currentText, QComboBox.setCurrentText, 'small'),
+        ('audio.noise_reduction', 'audio_noise_reduction', QCheckBox.isChecked, QCheckBox.setChecked, False),
+        ('audio.vad_enabled', 'audio_vad_enabled', QCheckBox.isChecked, QCheckBox.setChecked, False),
+        ('hotkey.primary', 'hotkey_primary', _stripped_text, QLineEdit.setText, 'ctrl+space'),
+        ('hotkey.fallback', 'hotkey_fallback', _stripped_text, QLineEdit.setText, 'ctrl+shift+v'),
+        ('overlay.enabled', 'overlay_enabled', QCheckBox.isChecked, QCheckBox.setChecked, True),
+        ('overlay.position', 'overlay_position', QComboBox.currentText, QComboBox.setCurrentText, 'top-center'),
+        ('overlay.monitor', 'overlay_monitor', QComboBox.currentIndex, QComboBox.setCurrentIndex, 0),
+        ('overlay.auto_dismiss_ms', 'overlay_auto_dismiss_ms', QSlider.value, QSlider.setValue, 2500),
+        ('whisper.fp16', 'whisper_fp16', QCheckBox.isChecked, QCheckBox.setChecked, True),
+        ('whisper.beam_size', 'whisper_beam_size', QSpinBox.value, QSpinBox.setValue, 1),
+        ('whisper.temperature', 'whisper_temperature', QDoubleSpinBox.value, QDoubleSpinBox.setValue, 0.0),
+        ('storage.retention_days', 'storage_retention_days', QSpinBox.value, QSpinBox.setValue, 30),
+    )
+
     def __init__(self, config_manager):
         """
         Initialize settings panel
@@ -42,17 +362,18 @@ class SettingsPanel(QWidget):
             config_manager: ConfigManager instance
         """
         super().__init__()
+        self.setObjectName("settingsPanel")
         self.config = config_manager
 
-        # Store widgets for validation
-        self.widgets = {}
-        self.setting_groups = [] # Store group widgets for grid layout
+        # Store widgets for validation (filled in by the group builders)
+        self.widgets = _SettingsWidgets()
+        self._groups_built = False  # Groups are built on first show
+        self._devices_loaded = False  # Audio devices arrive from the thread pool
+        # Device index -> combo row, built as the combo is filled, so loading
+        # settings does not scan itemData() row by row
+        self._device_rows = {}
 
         self._setup_ui()
-        self._load_settings()
-        
-        # Install event filter for resize
-        self.installEventFilter(self)
 
         logger.info("SettingsPanel initialized")
 
@@ -65,51 +386,31 @@ class SettingsPanel(QWidget):
         - Overlay
         - Advanced
         """
+        # One sheet for the whole panel, parsed once and matched by selector
+        self.setStyleSheet(_PANEL_STYLE)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
 
         # Header
         header_label = QLabel("Settings")
-        header_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #ffffff;")
+        header_label.setObjectName("settingsHeader")
         layout.addWidget(header_label)
 
         # Scrollable area for settings
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setFrameShape(QScrollArea.Shape.NoFrame)
-        self.scroll.setStyleSheet("""
-            QScrollArea { background-color: transparent; border: none; }
-            QScrollBar:vertical {
-                background: #2d2d2d;
-                width: 10px;
-                margin: 0px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4d4d4d;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-        """)
 
         self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background-color: transparent;")
-        
-        # Grid layout for groups
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setSpacing(16)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        # Create setting groups and add to list
-        self.setting_groups.append(self._create_whisper_group())
-        self.setting_groups.append(self._create_audio_group())
-        self.setting_groups.append(self._create_hotkey_group())
-        self.setting_groups.append(self._create_overlay_group())
-        self.setting_groups.append(self._create_advanced_group())
+        self.scroll_content.setObjectName("settingsScrollContent")
         
-        # Initial layout
-        self._reflow_grid()
+        # Groups are stacked in a single column
+        self.content_layout = QVBoxLayout(self.scroll_content)
+        self.content_layout.setSpacing(16)
+
+        # Setting groups are created in _build_groups on first show
 
         self.scroll.setWidget(self.scroll_content)
         layout.addWidget(self.scroll, 1)
@@ -119,224 +420,278 @@ class SettingsPanel(QWidget):
         button_layout.setSpacing(8)
 
         save_btn = QPushButton("Save Settings")
+        save_btn.setObjectName("primaryButton")
         save_btn.clicked.connect(self.save_settings)
-        save_btn.setStyleSheet(self._primary_button_style())
 
         reset_btn = QPushButton("Reset to Defaults")
         reset_btn.clicked.connect(self.reset_to_defaults)
-        reset_btn.setStyleSheet(self._button_style())
 
+        # Transient confirmation shown next to the buttons after a save/reset
+        self._status_label = QLabel("")
+        self._status_label.setObjectName("saveStatusLabel")
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(2000)
+        self._status_timer.timeout.connect(self._status_label.clear)
+
+        button_layout.addWidget(self._status_label)
         button_layout.addStretch()
         button_layout.addWidget(reset_btn)
         button_layout.addWidget(save_btn)
 
         layout.addLayout(button_layout)
 
+    def showEvent(self, event):
+        """Build the setting groups the first time the panel is shown"""
+        self._build_groups()
+        super().showEvent(event)
+
+    def _build_groups(self):
+        """
+        Create the setting groups and load the current settings into them.
+        Deferred until first show: building queries the GPU and the audio
+        devices, which the app does not need until Settings is opened.
+        """
+        if self._groups_built:
+            return
+        self._groups_built = True
+
+        # Create setting groups, top-aligned, and fill them with updates off
+        # so the whole build is painted once
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            self.content_layout.addWidget(self._create_whisper_group())
+            self.content_layout.addWidget(self._create_audio_group())
+            self.content_layout.addWidget(self._create_hotkey_group())
+            self.content_layout.addWidget(self._create_overlay_group())
+            self.content_layout.addWidget(self._create_advanced_group())
+            self.content_layout.addStretch()
+
+            # Loading the saved model must not look like a user model change
+            self._load_settings(emit_model_change=False)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
     def _create_whisper_group(self) -> QGroupBox:
         """Create Whisper Model settings group"""
+        from app.core.whisper_engine import WhisperEngine
+
         group = QGroupBox("Whisper Model")
-        group.setStyleSheet(self._group_style())
 
-        form = QFormLayout(group)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 24, 16, 16)
+        grid = QGridLayout(group)
+        grid.setSpacing(12)
+        grid.setContentsMargins(16, 24, 16, 16)
+        grid.setColumnStretch(1, 1)
+        row = 0
 
         # Get available VRAM
-        available_vram = WhisperEngine.get_available_vram()
+        available_vram = _available_vram()
         
         # Model dropdown with VRAM validation
         model_combo = QComboBox()
-        self.widgets['whisper.model'] = model_combo
+        self.widgets.whisper_model = model_combo
         
-        # Use StandardItemModel to support disabling items
+        # Use StandardItemModel to support disabling items; rows are
+        # collected first and inserted in one call
         model_item_model = QStandardItemModel()
+        vram_reqs = WhisperEngine.MODEL_VRAM_REQS
+        items = []
         
         for model_name in WhisperEngine.VALID_MODELS:
-            req_vram = WhisperEngine.MODEL_VRAM_REQS.get(model_name, 0)
+            req_vram = vram_reqs.get(model_name, 0)
             item = QStandardItem(model_name)
             
             # Disable if insufficient VRAM (with 0.5 GB buffer)
             if available_vram > 0 and req_vram > (available_vram + 0.5):
                 item.setEnabled(False)
-                item.setForeground(QBrush(QColor("#666666")))
-                item.setToolTip(f"Requires ~{req_vram} GB VRAM (Available: {available_vram:.1f} GB)")
+                item.setForeground(_DISABLED_BRUSH)
+                item.setToolTip(_DISABLED_TOOLTIP_FMT.format(req_vram, available_vram))
             else:
-                item.setToolTip(f"Estimated VRAM: ~{req_vram} GB")
+                item.setToolTip(_MODEL_TOOLTIP_FMT.format(req_vram))
                 
-            model_item_model.appendRow(item)
+            items.append(item)
             
+        model_item_model.appendColumn(items)
         model_combo.setModel(model_item_model)
-        model_combo.setStyleSheet(self._combo_style())
         model_combo.currentTextChanged.connect(self._on_model_selection_changed)
         
-        form.addRow("Model:", model_combo)
+        row = _add_grid_row(grid, row, "Model:", model_combo)
 
         # Language dropdown
         lang_combo = QComboBox()
-        languages = [
-            ('Auto-detect', None),
-            ('English', 'en'),
-            ('Spanish', 'es'),
-            ('French', 'fr'),
-            ('German', 'de'),
-            ('Italian', 'it'),
-            ('Portuguese', 'pt'),
-            ('Dutch', 'nl'),
-            ('Russian', 'ru'),
-            ('Chinese', 'zh'),
-            ('Japanese', 'ja'),
-            ('Korean', 'ko'),
-            ('Tamil', 'ta')
-        ]
-        for name, code in languages:
-            lang_combo.addItem(name, code)
-        lang_combo.setStyleSheet(self._combo_style())
-        self.widgets['whisper.language'] = lang_combo
-        form.addRow("Language:", lang_combo)
+        lang_items = [QStandardItem(name) for name, _ in _LANGUAGES]
+        for item, (_, code) in zip(lang_items, _LANGUAGES):
+            item.setData(code, Qt.ItemDataRole.UserRole)
+        lang_model = QStandardItemModel(lang_combo)
+        lang_model.invisibleRootItem().appendColumn(lang_items)
+        lang_combo.setModel(lang_model)
+        self.widgets.whisper_language = lang_combo
+        row = _add_grid_row(grid, row, "Language:", lang_combo)
 
         # Device (read-only for now)
         device_label = QLabel()
-        device_label.setStyleSheet("color: #cccccc;")
-        self.widgets['whisper.device_label'] = device_label
-        form.addRow("Device:", device_label)
+        device_label.setObjectName("deviceLabel")
+        self.widgets.whisper_device_label = device_label
+        row = _add_grid_row(grid, row, "Device:", device_label)
 
         # VRAM Usage Info
         self.vram_estimates_label = QLabel("")
-        self.vram_estimates_label.setStyleSheet("color: #aaaaaa; font-style: italic;")
-        form.addRow("", self.vram_estimates_label)
+        self.vram_estimates_label.setObjectName("vramEstimateLabel")
+        row = _add_grid_row(grid, row, "", self.vram_estimates_label)
 
         # Actual VRAM usage label (updated externally)
         vram_label = QLabel("N/A")
-        vram_label.setStyleSheet("color: #888888;")
-        self.widgets['vram_label'] = vram_label
-        form.addRow("Actual VRAM:", vram_label)
+        vram_label.setObjectName("vramLabel")
+        self.widgets.vram_label = vram_label
+        row = _add_grid_row(grid, row, "Actual VRAM:", vram_label)
 
         return group
 
     def _create_audio_group(self) -> QGroupBox:
         """Create Audio settings group"""
         group = QGroupBox("Audio")
-        group.setStyleSheet(self._group_style())
 
-        form = QFormLayout(group)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 24, 16, 16)
+        grid = QGridLayout(group)
+        grid.setSpacing(12)
+        grid.setContentsMargins(16, 24, 16, 16)
+        grid.setColumnStretch(1, 1)
+        row = 0
 
         # Device selector
+        # Device enumeration can stall for a while on some backends, so it
+        # runs on the thread pool and the combo is filled in _populate_devices
         device_combo = QComboBox()
-        device_combo.setStyleSheet(self._combo_style())
-        try:
-            devices = AudioRecorder.list_devices()
-            device_combo.addItem("Default Microphone", None)
-            for dev in devices:
-                device_combo.addItem(
-                    f"{dev['name']} ({dev['sample_rate']}Hz)",
-                    dev['index']
-                )
-        except Exception as e:
-            logger.error(f"Failed to list audio devices: {e}")
-            device_combo.addItem("Error loading devices", None)
+        device_combo.addItem("Loading devices...", None)
+        device_combo.setEnabled(False)
 
-        self.widgets['audio.device'] = device_combo
-        form.addRow("Device:", device_combo)
+        self.widgets.audio_device = device_combo
+        row = _add_grid_row(grid, row, "Device:", device_combo)
+
+        self._device_signals = _DeviceListSignals(self)
+        self._device_signals.listed.connect(self._populate_devices, Qt.ConnectionType.QueuedConnection)
+        self._device_signals.failed.connect(self._on_device_list_failed, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(_DeviceListTask(self._device_signals))
 
         # Test button
         test_btn = QPushButton("Test Recording (2s)")
         test_btn.clicked.connect(self._test_recording)
-        test_btn.setStyleSheet(self._button_style())
-        form.addRow("", test_btn)
+        row = _add_grid_row(grid, row, "", test_btn)
 
         # Noise reduction checkbox
         noise_cb = QCheckBox("Enable noise reduction")
-        noise_cb.setStyleSheet("color: #cccccc;")
-        self.widgets['audio.noise_reduction'] = noise_cb
-        form.addRow("", noise_cb)
+        self.widgets.audio_noise_reduction = noise_cb
+        row = _add_grid_row(grid, row, "", noise_cb)
 
         # VAD checkbox
         vad_cb = QCheckBox("Enable Voice Activity Detection")
-        vad_cb.setStyleSheet("color: #cccccc;")
-        self.widgets['audio.vad_enabled'] = vad_cb
-        form.addRow("", vad_cb)
+        self.widgets.audio_vad_enabled = vad_cb
+        row = _add_grid_row(grid, row, "", vad_cb)
 
         return group
 
+    def _populate_devices(self, devices: list):
+        """Fill the device combo once enumeration finishes (UI thread)"""
+        device_combo = self.widgets.audio_device
+        device_combo.clear()
+        device_combo.addItem("Default Microphone", None)
+        for dev in devices:
+            device_combo.addItem(
+                f"{dev['name']} ({dev['sample_rate']}Hz)",
+                dev['index']
+            )
+        device_combo.setEnabled(True)
+        self._device_rows = {dev['index']: row for row, dev in enumerate(devices, 1)}
+
+        self._devices_loaded = True
+        self._select_audio_device(self.config.get('audio.device'))
+
+    def _on_device_list_failed(self, error: str):
+        """Show the enumeration failure in the device combo (UI thread)"""
+        logger.error(f"Failed to list audio devices: {error}")
+        device_combo = self.widgets.audio_device
+        device_combo.clear()
+        device_combo.addItem("Error loading devices", None)
+        device_combo.setEnabled(True)
+        self._device_rows = {}
+        self._devices_loaded = True
+
+    def _select_audio_device(self, audio_device):
+        """Select the combo entry for a device index (None = default)"""
+        row = 0 if audio_device is None else self._device_rows.get(audio_device)
+        if row is not None:
+            self.widgets.audio_device.setCurrentIndex(row)
+
     def _create_hotkey_group(self) -> QGroupBox:
         """Create Hotkey settings group"""
         group = QGroupBox("Hotkey")
-        group.setStyleSheet(self._group_style())
 
-        form = QFormLayout(group)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 24, 16, 16)
+        grid = QGridLayout(group)
+        grid.setSpacing(12)
+        grid.setContentsMargins(16, 24, 16, 16)
+        grid.setColumnStretch(1, 1)
+        row = 0
 
         # Primary hotkey
         primary_layout = QHBoxLayout()
         primary_edit = QLineEdit()
         primary_edit.setPlaceholderText("e.g., ctrl+space")
-        primary_edit.setStyleSheet(self._lineedit_style())
-        self.widgets['hotkey.primary'] = primary_edit
+        self.widgets.hotkey_primary = primary_edit
 
         primary_test_btn = QPushButton("Test")
         primary_test_btn.setFixedWidth(70)
         primary_test_btn.clicked.connect(lambda: self._test_hotkey('primary'))
-        primary_test_btn.setStyleSheet(self._button_style())
 
         primary_layout.addWidget(primary_edit, 1)
         primary_layout.addWidget(primary_test_btn)
-        form.addRow("Primary:", primary_layout)
+        row = _add_grid_row(grid, row, "Primary:", primary_layout)
 
         # Fallback hotkey
         fallback_layout = QHBoxLayout()
         fallback_edit = QLineEdit()
         fallback_edit.setPlaceholderText("e.g., ctrl+shift+v")
-        fallback_edit.setStyleSheet(self._lineedit_style())
-        self.widgets['hotkey.fallback'] = fallback_edit
+        self.widgets.hotkey_fallback = fallback_edit
 
         fallback_test_btn = QPushButton("Test")
         fallback_test_btn.setFixedWidth(70)
         fallback_test_btn.clicked.connect(lambda: self._test_hotkey('fallback'))
-        fallback_test_btn.setStyleSheet(self._button_style())
 
         fallback_layout.addWidget(fallback_edit, 1)
         fallback_layout.addWidget(fallback_test_btn)
-        form.addRow("Fallback:", fallback_layout)
+        row = _add_grid_row(grid, row, "Fallback:", fallback_layout)
 
         # Reset button
         reset_btn = QPushButton("Reset to Default")
         reset_btn.clicked.connect(self._reset_hotkeys)
-        reset_btn.setStyleSheet(self._button_style())
-        form.addRow("", reset_btn)
+        row = _add_grid_row(grid, row, "", reset_btn)
 
         return group
 
     def _create_overlay_group(self) -> QGroupBox:
         """Create Overlay settings group"""
         group = QGroupBox("Overlay")
-        group.setStyleSheet(self._group_style())
 
-        form = QFormLayout(group)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 24, 16, 16)
+        grid = QGridLayout(group)
+        grid.setSpacing(12)
+        grid.setContentsMargins(16, 24, 16, 16)
+        grid.setColumnStretch(1, 1)
+        row = 0
 
         # Enabled checkbox
         enabled_cb = QCheckBox("Enable overlay")
-        enabled_cb.setStyleSheet("color: #cccccc;")
-        self.widgets['overlay.enabled'] = enabled_cb
-        form.addRow("", enabled_cb)
+        self.widgets.overlay_enabled = enabled_cb
+        row = _add_grid_row(grid, row, "", enabled_cb)
 
         # Position dropdown
         position_combo = QComboBox()
         position_combo.addItems(['top-center', 'top-left', 'top-right', 'bottom-center', 'bottom-left', 'bottom-right'])
-        position_combo.setStyleSheet(self._combo_style())
-        self.widgets['overlay.position'] = position_combo
-        form.addRow("Position:", position_combo)
+        self.widgets.overlay_position = position_combo
+        row = _add_grid_row(grid, row, "Position:", position_combo)
 
         # Monitor dropdown
         monitor_combo = QComboBox()
         monitor_combo.addItems(['Primary (0)', 'Secondary (1)', 'Tertiary (2)'])
-        monitor_combo.setStyleSheet(self._combo_style())
-        self.widgets['overlay.monitor'] = monitor_combo
-        form.addRow("Monitor:", monitor_combo)
+        self.widgets.overlay_monitor = monitor_combo
+        row = _add_grid_row(grid, row, "Monitor:", monitor_combo)
 
         # Auto-dismiss slider
         dismiss_layout = QVBoxLayout()
@@ -345,10 +700,10 @@ class SettingsPanel(QWidget):
         dismiss_slider.setSingleStep(100)
         dismiss_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         dismiss_slider.setTickInterval(1000)
-        dismiss_slider.setStyleSheet(self._slider_style())
 
         dismiss_label = QLabel("2500 ms")
-        dismiss_label.setStyleSheet("color: #888888; font-size: 12px;")
+        dismiss_label.setObjectName("dismissLabel")
+        self._dismiss_label = dismiss_label
         dismiss_slider.valueChanged.connect(
             lambda v: dismiss_label.setText(f"{v} ms")
         )
@@ -356,34 +711,33 @@ class SettingsPanel(QWidget):
         dismiss_layout.addWidget(dismiss_slider)
         dismiss_layout.addWidget(dismiss_label)
 
-        self.widgets['overlay.auto_dismiss_ms'] = dismiss_slider
-        form.addRow("Auto-dismiss:", dismiss_layout)
+        self.widgets.overlay_auto_dismiss_ms = dismiss_slider
+        row = _add_grid_row(grid, row, "Auto-dismiss:", dismiss_layout)
 
         return group
 
     def _create_advanced_group(self) -> QGroupBox:
         """Create Advanced settings group"""
         group = QGroupBox("Advanced")
-        group.setStyleSheet(self._group_style())
 
-        form = QFormLayout(group)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 24, 16, 16)
+        grid = QGridLayout(group)
+        grid.setSpacing(12)
+        grid.setContentsMargins(16, 24, 16, 16)
+        grid.setColumnStretch(1, 1)
+        row = 0
 
         # fp16 checkbox
         fp16_cb = QCheckBox("fp16 (GPU optimization)")
-        fp16_cb.setStyleSheet("color: #cccccc;")
-        self.widgets['whisper.fp16'] = fp16_cb
-        form.addRow("", fp16_cb)
+        self.widgets.whisper_fp16 = fp16_cb
+        row = _add_grid_row(grid, row, "", fp16_cb)
 
         # Beam size
         beam_spin = QSpinBox()
         beam_spin.setRange(1, 5)
         beam_spin.setValue(1)
-        beam_spin.setStyleSheet(self._spinbox_style())
         beam_spin.setToolTip("Number of alternative paths to search. Higher = better accuracy but slower.")
-        self.widgets['whisper.beam_size'] = beam_spin
-        form.addRow("Beam size:", beam_spin)
+        self.widgets.whisper_beam_size = beam_spin
+        row = _add_grid_row(grid, row, "Beam size:", beam_spin)
 
         # Temperature
         temp_spin = QDoubleSpinBox()
@@ -391,10 +745,9 @@ class SettingsPanel(QWidget):
         temp_spin.setSingleStep(0.1)
         temp_spin.setDecimals(1)
         temp_spin.setValue(0.0)
-        temp_spin.setStyleSheet(self._spinbox_style())
         temp_spin.setToolTip("Higher values = more creative/random. Lower = more deterministic.")
-        self.widgets['whisper.temperature'] = temp_spin
-        form.addRow("Temperature:", temp_spin)
+        self.widgets.whisper_temperature = temp_spin
+        row = _add_grid_row(grid, row, "Temperature:", temp_spin)
 
         # History retention
         retention_spin = QSpinBox()
@@ -402,93 +755,64 @@ class SettingsPanel(QWidget):
         retention_spin.setValue(30)
         retention_spin.setSpecialValueText("Unlimited")
         retention_spin.setSuffix(" days")
-        retention_spin.setStyleSheet(self._spinbox_style())
-        self.widgets['storage.retention_days'] = retention_spin
-        form.addRow("History retention:", retention_spin)
+        self.widgets.storage_retention_days = retention_spin
+        row = _add_grid_row(grid, row, "History retention:", retention_spin)
 
         return group
 
-    def _load_settings(self):
-        """Load current settings from ConfigManager into UI controls"""
-        try:
-            # Whisper
-            model = self.config.get('whisper.model', 'small')
-            self.widgets['whisper.model'].setCurrentText(model)
-
-            language = self.config.get('whisper.language')
-            lang_combo = self.widgets['whisper.language']
-            for i in range(lang_combo.count()):
-                if lang_combo.itemData(i) == language:
-                    lang_combo.setCurrentIndex(i)
-                    break
-
-            device = self.config.get('whisper.device', 'cuda')
-            self.widgets['whisper.device_label'].setText(device.upper())
-
-            # Audio
-            audio_device = self.config.get('audio.device')
-            device_combo = self.widgets['audio.device']
-            if audio_device is None:
-                device_combo.setCurrentIndex(0)
-            else:
-                for i in range(device_combo.count()):
-                    if device_combo.itemData(i) == audio_device:
-                        device_combo.setCurrentIndex(i)
-                        break
+    def _load_settings(self, emit_model_change: bool = True):
+        """
+        Load current settings from ConfigManager into UI controls
 
-            self.widgets['audio.noise_reduction'].setChecked(
-                self.config.get('audio.noise_reduction', False)
-            )
-            self.widgets['audio.vad_enabled'].setChecked(
-                self.config.get('audio.vad_enabled', False)
-            )
+        Change signals are blocked during the load; afterwards the dependent
+        labels are refreshed once and, if the model changed and
+        emit_model_change is set, model_changed is emitted once.
+        """
+        if not self._groups_built:
+            return  # Loaded when the groups are built
 
-            # Hotkey
-            self.widgets['hotkey.primary'].setText(
-                self.config.get('hotkey.primary', 'ctrl+space')
-            )
-            self.widgets['hotkey.fallback'].setText(
-                self.config.get('hotkey.fallback', 'ctrl+shift+v')
-            )
+        model_combo = self.widgets.whisper_model
+        previous_model = model_combo.currentText()
+        blockers = [QSignalBlocker(w) for w in self.widgets.all()]
+        try:
+            config = self.config
+            widgets = self.widgets
+            for key, attr, _, setter, default in self._CONFIG_MAP:
+                setter(getattr(widgets, attr), config.get(key, default))
 
-            # Overlay
-            self.widgets['overlay.enabled'].setChecked(
-                self.config.get('overlay.enabled', True)
-            )
-            self.widgets['overlay.position'].setCurrentText(
-                self.config.get('overlay.position', 'top-center')
-            )
-            self.widgets['overlay.monitor'].setCurrentIndex(
-                self.config.get('overlay.monitor', 0)
-            )
-            self.widgets['overlay.auto_dismiss_ms'].setValue(
-                self.config.get('overlay.auto_dismiss_ms', 2500)
-            )
+            # Settings stored as combo item data or shown read-only
+            row = _LANGUAGE_ROWS.get(config.get('whisper.language'))
+            if row is not None:
+                widgets.whisper_language.setCurrentIndex(row)
 
-            # Advanced
-            self.widgets['whisper.fp16'].setChecked(
-                self.config.get('whisper.fp16', True)
-            )
-            self.widgets['whisper.beam_size'].setValue(
-                self.config.get('whisper.beam_size', 1)
-            )
-            self.widgets['whisper.temperature'].setValue(
-                self.config.get('whisper.temperature', 0.0)
-            )
-            self.widgets['storage.retention_days'].setValue(
-                self.config.get('storage.retention_days', 30)
-            )
+            device = config.get('whisper.device', 'cuda')
+            widgets.whisper_device_label.setText(device.upper())
+
+            if self._devices_loaded:
+                self._select_audio_device(config.get('audio.device'))
 
             logger.info("Settings loaded into UI")
 
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
+        dismiss_ms = self.widgets.overlay_auto_dismiss_ms.value()
+        self._dismiss_label.setText(f"{dismiss_ms} ms")
+
+        model = model_combo.currentText()
+        if emit_model_change and model != previous_model:
+            self._on_model_selection_changed(model)
+        else:
+            self._update_vram_estimate(model)
 
     def save_settings(self):
         """
         Save all settings to ConfigManager and emit signal
         Validates inputs before saving.
-        Shows success message on save.
+        Shows a transient confirmation next to the buttons on save.
         """
         try:
             # Validate first
@@ -501,48 +825,17 @@ class SettingsPanel(QWidget):
                 )
                 return
 
-            # Save Whisper settings
-            self.config.set('whisper.model', self.widgets['whisper.model'].currentText())
-
-            lang_combo = self.widgets['whisper.language']
-            language = lang_combo.currentData()
-            self.config.set('whisper.language', language)
-
-            # Audio settings
-            device_combo = self.widgets['audio.device']
-            audio_device = device_combo.currentData()
-            self.config.set('audio.device', audio_device)
-
-            self.config.set('audio.noise_reduction',
-                          self.widgets['audio.noise_reduction'].isChecked())
-            self.config.set('audio.vad_enabled',
-                          self.widgets['audio.vad_enabled'].isChecked())
-
-            # Hotkey settings
-            self.config.set('hotkey.primary',
-                          self.widgets['hotkey.primary'].text().strip())
-            self.config.set('hotkey.fallback',
-                          self.widgets['hotkey.fallback'].text().strip())
-
-            # Overlay settings
-            self.config.set('overlay.enabled',
-                          self.widgets['overlay.enabled'].isChecked())
-            self.config.set('overlay.position',
-                          self.widgets['overlay.position'].currentText())
-            self.config.set('overlay.monitor',
-                          self.widgets['overlay.monitor'].currentIndex())
-            self.config.set('overlay.auto_dismiss_ms',
-                          self.widgets['overlay.auto_dismiss_ms'].value())
-
-            # Advanced settings
-            self.config.set('whisper.fp16',
-                          self.widgets['whisper.fp16'].isChecked())
-            self.config.set('whisper.beam_size',
-                          self.widgets['whisper.beam_size'].value())
-            self.config.set('whisper.temperature',
-                          self.widgets['whisper.temperature'].value())
-            self.config.set('storage.retention_days',
-                          self.widgets['storage.retention_days'].value())
+            config = self.config
+            widgets = self.widgets
+            for key, attr, getter, _, _ in self._CONFIG_MAP:
+                config.set(key, getter(getattr(widgets, attr)))
+
+            # Settings stored as combo item data
+            config.set('whisper.language', widgets.whisper_language.currentData())
+
+            # Keep the saved device if the list has not arrived yet
+            if self._devices_loaded:
+                config.set('audio.device', widgets.audio_device.currentData())
 
             # Save to file
             self.config.save()
@@ -552,11 +845,7 @@ class SettingsPanel(QWidget):
 
             logger.info("Settings saved successfully")
 
-            QMessageBox.information(
-                self,
-                "Settings Saved",
-                "Settings have been saved successfully!"
-            )
+            self._show_status("Settings saved")
 
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
@@ -588,11 +877,7 @@ class SettingsPanel(QWidget):
 
                 logger.info("Settings reset to defaults")
 
-                QMessageBox.information(
-                    self,
-                    "Reset Complete",
-                    "Settings have been reset to defaults."
-                )
+                self._show_status("Settings reset to defaults")
 
             except Exception as e:
                 logger.error(f"Failed to reset settings: {e}")
@@ -602,6 +887,11 @@ class SettingsPanel(QWidget):
                     f"Failed to reset settings:\n{str(e)}"
                 )
 
+    def _show_status(self, message: str):
+        """Show a confirmation that clears itself after 2 seconds"""
+        self._status_label.setText(message)
+        self._status_timer.start()  # Restarts if a message is already shown
+
     def validate_settings(self) -> tuple[bool, str]:
         """
         Validate all settings
@@ -612,27 +902,27 @@ class SettingsPanel(QWidget):
         errors = []
 
         # Validate hotkeys
-        primary = self.widgets['hotkey.primary'].text().strip()
+        primary = self.widgets.hotkey_primary.text().strip()
         if not primary:
             errors.append("Primary hotkey cannot be empty")
-        elif '+' not in primary:
+        elif not _HOTKEY_RE.match(primary):
             errors.append("Primary hotkey must include modifier (e.g., ctrl+space)")
 
-        fallback = self.widgets['hotkey.fallback'].text().strip()
+        fallback = self.widgets.hotkey_fallback.text().strip()
         if not fallback:
             errors.append("Fallback hotkey cannot be empty")
-        elif '+' not in fallback:
+        elif not _HOTKEY_RE.match(fallback):
             errors.append("Fallback hotkey must include modifier")
 
-        if primary.lower() == fallback.lower():
+        if primary.casefold() == fallback.casefold():
             errors.append("Primary and fallback hotkeys must be different")
 
         # Validate numeric ranges
-        beam_size = self.widgets['whisper.beam_size'].value()
+        beam_size = self.widgets.whisper_beam_size.value()
         if beam_size < 1 or beam_size > 5:
             errors.append("Beam size must be between 1 and 5")
 
-        temp = self.widgets['whisper.temperature'].value()
+        temp = self.widgets.whisper_temperature.value()
         if temp < 0.0 or temp > 1.0:
             errors.append("Temperature must be between 0.0 and 1.0")
 
@@ -646,7 +936,12 @@ class SettingsPanel(QWidget):
         # Emit change signal
         self.model_changed.emit(model_name)
         
-        # Update estimate label
+        self._update_vram_estimate(model_name)
+
+    def _update_vram_estimate(self, model_name: str):
+        """Show the estimated checkpoint size for a model"""
+        from app.core.whisper_engine import WhisperEngine
+
         req_vram = WhisperEngine.MODEL_VRAM_REQS.get(model_name, 0)
         self.vram_estimates_label.setText(f"Estimated Checkpoint Size: ~{req_vram} GB")
 
@@ -664,7 +959,7 @@ class SettingsPanel(QWidget):
 
     def _test_hotkey(self, which: str):
         """Test hotkey detection"""
-        hotkey = self.widgets[f'hotkey.{which}'].text()
+        hotkey = getattr(self.widgets, f'hotkey_{which}').text()
         QMessageBox.information(
             self,
             "Hotkey Test",
@@ -673,172 +968,7 @@ class SettingsPanel(QWidget):
             "(Full implementation requires HotkeyManager integration)"
         )
 
-    def eventFilter(self, obj, event):
-        """Handle resize events to reflow grid"""
-        if obj == self and event.type() == QEvent.Type.Resize:
-            self._reflow_grid()
-        return super().eventFilter(obj, event)
-
-    def _reflow_grid(self):
-        """
-        Reflow groups into grid.
-        Fixed layout: 2 columns.
-        """
-        # Clear layout
-        while self.grid_layout.count():
-            self.grid_layout.takeAt(0)
-            
-        cols = 1
-            
-        for i, widget in enumerate(self.setting_groups):
-            row = i // cols
-            col = i % cols
-            self.grid_layout.addWidget(widget, row, col)
-            
-        # Set stretch
-        for c in range(cols):
-            self.grid_layout.setColumnStretch(c, 1)
-
-    # Stylesheet methods
     def _reset_hotkeys(self):
         """Reset hotkeys to default values"""
-        self.widgets['hotkey.primary'].setText('ctrl+space')
-        self.widgets['hotkey.fallback'].setText('ctrl+shift+v')
-
-    # Stylesheet methods
-    def _group_style(self) -> str:
-        """GroupBox stylesheet"""
-        return """
-            QGroupBox {
-                border: 1px solid #3d3d3d;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding: 12px;
-                font-weight: bold;
-                color: #ffffff;
-                background-color: #252525;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 8px;
-                background-color: transparent;
-            }
-        """
-
-    def _combo_style(self) -> str:
-        """ComboBox stylesheet"""
-        return """
-            QComboBox {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px 10px;
-                color: #ffffff;
-                min-width: 200px;
-            }
-            QComboBox:hover {
-                border-color: #0078d4;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                selection-background-color: #0078d4;
-                color: #ffffff;
-            }
-        """
-
-    def _lineedit_style(self) -> str:
-        """LineEdit stylesheet"""
-        return """
-            QLineEdit {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px 10px;
-                color: #ffffff;
-            }
-            QLineEdit:focus {
-                border-color: #0078d4;
-            }
-        """
-
-    def _button_style(self) -> str:
-        """Button stylesheet"""
-        return """
-            QPushButton {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #ffffff;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #4d4d4d;
-            }
-        """
-
-    def _primary_button_style(self) -> str:
-        """Primary button stylesheet"""
-        return """
-            QPushButton {
-                background-color: #0078d4;
-                border: 1px solid #0078d4;
-                border-radius: 4px;
-                padding: 10px 24px;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-                border-color: #005a9e;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-        """
-
-    def _spinbox_style(self) -> str:
-        """SpinBox stylesheet"""
-        return """
-            QSpinBox, QDoubleSpinBox {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px 10px;
-                color: #ffffff;
-            }
-            QSpinBox:hover, QDoubleSpinBox:hover {
-                border-color: #0078d4;
-            }
-        """
-
-    def _slider_style(self) -> str:
-        """Slider stylesheet"""
-        return """
-            QSlider::groove:horizontal {
-                background: #3d3d3d;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #0078d4;
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #005a9e;
-            }
-        """
+        self.widgets.hotkey_primary.setText('ctrl+space')
+        self.widgets.hotkey_fallback.setText('ctrl+shift+v')
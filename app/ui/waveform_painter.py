@@ -8,14 +8,91 @@ Author: Whisper-Free Project
 License: MIT
 """
 
-from PySide6.QtGui import QPainter, QColor, QLinearGradient, QPen, QPainterPath
-from PySide6.QtCore import Qt, QRectF, QPointF
-from typing import List
+from PySide6.QtGui import (
+    QPainter, QColor, QLinearGradient, QPixmap, QBrush,
+    QTransform
+)
+from PySide6.QtCore import Qt, QRect, QRectF
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple, Union
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _bar_x_positions(
+    widget_x: int,
+    widget_width: int,
+    bar_count: int,
+    bar_width: int,
+    bar_spacing: int
+) -> Tuple[int, ...]:
+    """
+    Left edge of each bar, centering the whole waveform in the widget on
+    whole pixels.
+    """
+    total_width = (bar_width * bar_count) + (bar_spacing * (bar_count - 1))
+    start_x = widget_x + (widget_width - total_width) // 2
+    pitch = bar_width + bar_spacing
+    return tuple(range(start_x, start_x + bar_count * pitch, pitch))
+
+
+def _bar_heights(
+    waveform_data: Union[Sequence[float], np.ndarray],
+    bar_count: int,
+    min_height: int,
+    max_height: int,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Resample levels to bar_count values and map them to bar heights.
+
+    Levels are clamped to 0.0-1.0 and interpolated between min_height and
+    max_height, in place in out (a float32 array of bar_count values). A
+    float32 array input is read without being copied or modified.
+    """
+    data = np.asarray(waveform_data, dtype=np.float32)
+    if data.size == bar_count:
+        np.clip(data, 0.0, 1.0, out=out)
+    else:
+        if data.size < bar_count:
+            # Pad with zeros
+            out[data.size:] = 0.0
+            out[:data.size] = data
+        else:
+            # Downsample by taking evenly spaced samples
+            step = data.size / bar_count
+            np.take(data, (np.arange(bar_count) * step).astype(np.intp),
+                    out=out)
+        np.clip(out, 0.0, 1.0, out=out)
+
+    out *= max_height - min_height
+    out += min_height
+    return out
+
+
+@lru_cache(maxsize=4)
+def _bar_gradient(max_height: int) -> QLinearGradient:
+    """
+    Bar gradient (top to bottom: Indigo 50 to Indigo 400) spanning
+    0..max_height; callers translate it to where the bar range starts.
+    """
+    gradient = QLinearGradient(0, 0, 0, max_height)
+    gradient.setColorAt(0.0, QColor("#E8EAF6"))  # Greyish White (Indigo 50)
+    gradient.setColorAt(1.0, QColor("#5C6BC0"))  # Indigo 400
+    return gradient
+
+
+def _gradient_brush(max_height: int, top: float) -> QBrush:
+    """Brush painting the shared bar gradient with its top edge at top."""
+    brush = QBrush(_bar_gradient(max_height))
+    brush.setTransform(QTransform.fromTranslate(0, top))
+    return brush
+
+
 class WaveformPainter:
     """
     Custom painter for audio waveform visualization.
@@ -26,104 +103,172 @@ class WaveformPainter:
 
     Example:
         >>> painter = QPainter(widget)
-        >>> painter.setRenderHint(QPainter.Antialiasing)
         >>> waveform_data = [0.5, 0.7, 0.3, 0.8, ...]  # 30 values
         >>> WaveformPainter.paint_waveform(
         ...     painter, waveform_data, widget.rect()
         ... )
     """
 
-    @staticmethod
+    # Pre-rendered rounded bars keyed by whole-pixel height, valid for one
+    # (bar_width, max_height, corner_radius, device pixel ratio) combination
+    _bar_pixmaps: Dict[int, QPixmap] = {}
+    _bar_pixmaps_geom: Optional[Tuple[int, int, float, float]] = None
+
+    # Scratch buffers for bar heights (float and whole-pixel) and tops,
+    # reallocated only when bar_count changes
+    _heights_buf = np.zeros(30, dtype=np.float32)
+    _heights_int_buf = np.zeros(30, dtype=np.int32)
+    _tops_buf = np.zeros(30, dtype=np.int32)
+
+    @classmethod
     def paint_waveform(
+        cls,
         painter: QPainter,
-        waveform_data: List[float],
+        waveform_data: Union[Sequence[float], np.ndarray],
         widget_rect,
         bar_count: int = 30,
         bar_width: int = 4,
         bar_spacing: int = 6,
         min_height: int = 5,
-        max_height: int = 40
+        max_height: int = 40,
+        corner_radius: float = 2.0
     ) -> None:
         """
         Paint audio waveform bars with gradient fill.
 
         Args:
-            painter: QPainter instance (should have antialiasing enabled)
-            waveform_data: List of audio levels (0.0-1.0), typically 30-50 values
+            painter: QPainter instance (antialiasing is not needed, bars are
+                drawn on whole pixels)
+            waveform_data: Audio levels (0.0-1.0) as a list or numpy array,
+                typically 30-50 values; a float32 array is used without a copy
             widget_rect: QRect of the containing widget for positioning
             bar_count: Number of bars to render (default 30)
             bar_width: Width of each bar in pixels (default 4)
             bar_spacing: Spacing between bars in pixels (default 6)
             min_height: Minimum bar height in pixels (default 5)
             max_height: Maximum bar height in pixels (default 40)
+            corner_radius: Bar corner radius in pixels (default 2.0); 0 draws
+                square bars with a single drawRects call
 
         The bars are center-aligned horizontally and vertically in the widget.
         Each bar uses a linear gradient from #64b5f6 (top) to #4dd0e1 (bottom).
-        Bars have 2px rounded corners for smooth appearance.
+        Bars have 2px rounded corners for smooth appearance and are blitted
+        from pre-rendered pixmaps (or drawn as one rectangle batch when
+        corner_radius is 0).
 
         If waveform_data is empty or None, this method returns silently without
         painting anything.
 
         Performance:
-            Optimized for 30 FPS real-time updates. Uses QPainterPath for
-            efficient rounded rectangle rendering.
+            Optimized for 30 FPS real-time updates. Resampling, bar heights and
+            positions are computed for all bars in vectorized NumPy; Python only
+            loops over the Qt draw calls. Rounded bars are rasterized once per
+            whole-pixel height and then only blitted with drawPixmap.
         """
         # Handle empty or invalid data
-        if not waveform_data:
+        if waveform_data is None or len(waveform_data) == 0:
             logger.debug("Empty waveform data, skipping paint")
             return
 
-        # Ensure we have enough data, pad with zeros if needed
-        data = list(waveform_data)
-        if len(data) < bar_count:
-            # Pad with zeros
-            data.extend([0.0] * (bar_count - len(data)))
-        elif len(data) > bar_count:
-            # Downsample by taking evenly spaced samples
-            step = len(data) / bar_count
-            data = [data[int(i * step)] for i in range(bar_count)]
+        if cls._heights_buf.size != bar_count:
+            cls._heights_buf = np.zeros(bar_count, dtype=np.float32)
+            cls._heights_int_buf = np.zeros(bar_count, dtype=np.int32)
+            cls._tops_buf = np.zeros(bar_count, dtype=np.int32)
+        heights = _bar_heights(waveform_data, bar_count, min_height,
+                               max_height, cls._heights_buf)
 
-        # Calculate total width of waveform
-        total_width = (bar_width * bar_count) + (bar_spacing * (bar_count - 1))
+        # Center the waveform horizontally; the bar positions only depend on
+        # the geometry, so they are cached between frames
+        x_positions = _bar_x_positions(
+            int(widget_rect.x()), int(widget_rect.width()),
+            bar_count, bar_width, bar_spacing
+        )
+
+        # Round heights to whole pixels, so bars land on the pixel grid and
+        # rounded bars can be cached per height
+        np.rint(heights, out=heights)
+        np.copyto(cls._heights_int_buf, heights, casting="unsafe")
+        heights = cls._heights_int_buf
 
-        # Center the waveform horizontally
-        widget_width = widget_rect.width()
-        widget_height = widget_rect.height()
-        start_x = widget_rect.x() + (widget_width - total_width) / 2.0
+        # Bars under a pixel tall would not show up (only possible with
+        # min_height below 1), so leave them out of the draw calls
+        visible = np.flatnonzero(heights >= 1)
+        if visible.size == 0:
+            return
+        if visible.size < bar_count:
+            x_positions = [x_positions[i] for i in visible.tolist()]
+            heights = heights[visible]
 
         # Center vertically (bars grow up and down from center)
-        center_y = widget_rect.y() + (widget_height / 2.0)
-
-        # Create gradient for bars (top to bottom: Indigo 50 to Indigo 400)
-        gradient = QLinearGradient(0, center_y - max_height / 2,
-                                   0, center_y + max_height / 2)
-        gradient.setColorAt(0.0, QColor("#E8EAF6"))  # Greyish White (Indigo 50)
-        gradient.setColorAt(1.0, QColor("#5C6BC0"))  # Indigo 400
-
-        # Set painter properties
-        painter.setBrush(gradient)
-        painter.setPen(Qt.NoPen)  # No border on bars
-
-        # Draw each bar
-        for i in range(bar_count):
-            # Get level for this bar (clamped to 0.0-1.0)
-            level = max(0.0, min(1.0, data[i]))
-
-            # Calculate bar height based on level
-            # Interpolate between min_height and max_height
-            bar_height = min_height + (level * (max_height - min_height))
-
-            # Calculate bar position
-            bar_x = start_x + (i * (bar_width + bar_spacing))
-            bar_y = center_y - (bar_height / 2.0)
-
-            # Create rounded rectangle path
-            bar_rect = QRectF(bar_x, bar_y, bar_width, bar_height)
-
-            # Draw rounded rectangle (2px corner radius)
-            path = QPainterPath()
-            path.addRoundedRect(bar_rect, 2.0, 2.0)
-            painter.fillPath(path, gradient)
+        tops = cls._tops_buf[:heights.size]
+        np.subtract(int(widget_rect.height()), heights, out=tops)
+        tops //= 2
+        tops += int(widget_rect.y())
+
+        if corner_radius <= 0:
+            # Square bars: one batched drawRects call with the gradient brush
+            painter.setBrush(
+                _gradient_brush(
+                    max_height,
+                    widget_rect.y() + (widget_rect.height() - max_height) / 2.0
+                )
+            )
+            painter.setPen(Qt.NoPen)  # No border on bars
+            painter.drawRects([
+                QRect(bar_x, bar_y, bar_width, bar_height)
+                for bar_x, bar_height, bar_y
+                in zip(x_positions, heights.tolist(), tops.tolist())
+            ])
+            return
+
+        # Rounded bars: blit a cached pixmap per bar; with whole pixel
+        # heights the cache stays bounded by max_height
+        ratio = painter.device().devicePixelRatioF()
+        atlas_geom = (bar_width, max_height, corner_radius, ratio)
+        if cls._bar_pixmaps_geom != atlas_geom:
+            cls._bar_pixmaps = {}
+            cls._bar_pixmaps_geom = atlas_geom
+        pixmaps = cls._bar_pixmaps
+
+        draw_pixmap = painter.drawPixmap
+        for bar_x, bar_height, bar_y in zip(x_positions, heights.tolist(),
+                                            tops.tolist()):
+            pixmap = pixmaps.get(bar_height)
+            if pixmap is None:
+                pixmap = cls._render_bar(bar_width, bar_height, max_height,
+                                         corner_radius, ratio)
+                pixmaps[bar_height] = pixmap
+            draw_pixmap(bar_x, bar_y, pixmap)
+
+    @staticmethod
+    def _render_bar(
+        bar_width: int,
+        bar_height: int,
+        max_height: int,
+        corner_radius: float,
+        ratio: float
+    ) -> QPixmap:
+        """
+        Rasterize one rounded bar for the pixmap cache.
+
+        The gradient spans max_height around the bar's center, so every
+        cached bar shows the same slice of it as a bar painted in place.
+        """
+        pixmap = QPixmap(max(1, round(bar_width * ratio)),
+                         max(1, round(bar_height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        bar_painter = QPainter(pixmap)
+        bar_painter.setRenderHint(QPainter.Antialiasing)
+        bar_painter.setBrush(
+            _gradient_brush(max_height, (bar_height - max_height) / 2.0)
+        )
+        bar_painter.setPen(Qt.NoPen)  # No border on bars
+        bar_painter.drawRoundedRect(QRectF(0, 0, bar_width, bar_height),
+                                    corner_radius, corner_radius)
+        bar_painter.end()
+        return pixmap
 
     @staticmethod
     def get_waveform_dimensions(